@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from functools import lru_cache
+from functools import cache
 
 
 class Settings(BaseSettings):
@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # App
     app_env: str = "development"
     log_level: str = "INFO"
+    # uvicorn worker processes outside development. Gemini limiters live per process,
+    # so each worker gets 1/web_workers of the rpm and concurrency budgets (per_worker).
+    web_workers: int = 1
 
     # Elasticsearch index names
     index_entities: str = "meridian-entities"
@@ -26,15 +29,35 @@ class Settings(BaseSettings):
     index_news: str = "meridian-news"
     index_executives: str = "meridian-executives"
     index_investigations: str = "meridian-investigations"
+    index_llm_cache: str = "meridian-llm-cache"
+
+    # Agent LLM response cache (0 disables)
+    llm_cache_ttl_hours: int = 24
+    # Reuse a finished investigation of the same target this recent (0 disables)
+    investigation_cache_ttl_hours: int = 24
+    # On-disk cache of EDGAR fact indexes, revalidated by ETag/Last-Modified ("" disables)
+    edgar_cache_dir: str = ".cache/edgar"
+    # Use a cached EDGAR fact index this recent without asking SEC at all (0 always revalidates)
+    edgar_facts_ttl_hours: int = 24
 
     # Gemini model
     gemini_model: str = "gemini-2.5-flash"
+    gemini_embed_rpm: int = 300  # embedding requests/minute shared by all callers
+    gemini_generate_rpm: int = 10  # generate requests/minute shared by all agents; match your quota tier
+    gemini_max_concurrency: int = 16  # upper bound for the AIMD limiter on generate calls
+    gemini_latency_target: float = 20.0  # seconds; mean latency above this backs the limiter off
+    gemini_fused_reasoning: bool = False  # one composite Gemini call for all specialist agents
+
+    def per_worker(self, budget: int) -> int:
+        """This process's share of a budget split across uvicorn workers (at least 1)."""
+        workers = 1 if self.app_env == "development" else max(1, self.web_workers)
+        return max(1, budget // workers)
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     return Settings()
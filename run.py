@@ -2,6 +2,11 @@
 """
 Meridian entry point.
 Usage: python run.py
+
+APP_ENV=development (default) runs a single auto-reloading worker;
+any other APP_ENV runs WEB_WORKERS (default 1) workers without the reload watcher.
+Each worker process holds its own Gemini rate limiters, so the configured
+GEMINI_*_RPM / GEMINI_MAX_CONCURRENCY budgets are split evenly across workers.
 """
 import sys
 import os
@@ -11,10 +16,18 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import uvicorn
 
+from config import get_settings
+
 if __name__ == "__main__":
+    settings = get_settings()
+    dev = settings.app_env == "development"
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev,
+        workers=1 if dev else settings.web_workers,
+        loop="auto",   # uvloop when installed (uvicorn[standard]), asyncio otherwise
+        http="auto",   # httptools when installed, h11 otherwise
+        log_level=settings.log_level.lower(),
     )
@@ -7,13 +7,15 @@ entities, executives, legal cases, and news articles.
 This gives you a compelling demo without needing real API data.
 """
 import asyncio
-import json
 import sys
 import os
 from datetime import datetime, timezone
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import ijson
+from elasticsearch.helpers import async_bulk
+
 from src.elasticsearch.client import get_es_client, close_es_client
 from src.elasticsearch.indices import create_all_indices
 from config import get_settings
@@ -23,17 +25,22 @@ settings = get_settings()
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "sample")
 
 
+def _iter_actions(index: str, filepath: str, id_field: str):
+    """Stream records out of a JSON array file as bulk index actions."""
+    with open(filepath, "rb") as f:
+        for record in ijson.items(f, "item", use_float=True):
+            yield {"_op_type": "index", "_index": index, "_id": record.get(id_field), "_source": record}
+
+
 async def load_json_file(es, index: str, filepath: str, id_field: str):
     """Load a JSON file into an Elasticsearch index."""
-    with open(filepath) as f:
-        records = json.load(f)
-
-    for record in records:
-        doc_id = record.get(id_field)
-        await es.index(index=index, id=doc_id, document=record)
+    success, errors = await async_bulk(
+        es, _iter_actions(index, filepath, id_field),
+        chunk_size=500, raise_on_error=False, stats_only=False,
+    )
 
-    print(f"  Loaded {len(records)} records into {index}")
-    return len(records)
+    print(f"  Loaded {success} records into {index} ({len(errors)} errors)")
+    return success
 
 
 async def main():
@@ -51,28 +58,18 @@ async def main():
     # Ensure indices exist
     await create_all_indices(es)
 
-    # Load demo data
-    total = 0
-    total += await load_json_file(
-        es, settings.index_entities,
-        os.path.join(DATA_DIR, "companies.json"),
-        "entity_id"
-    )
-    total += await load_json_file(
-        es, settings.index_executives,
-        os.path.join(DATA_DIR, "executives.json"),
-        "person_id"
-    )
-    total += await load_json_file(
-        es, settings.index_legal,
-        os.path.join(DATA_DIR, "legal_cases.json"),
-        "case_id"
-    )
-    total += await load_json_file(
-        es, settings.index_news,
-        os.path.join(DATA_DIR, "news.json"),
-        "article_id"
-    )
+    # Load demo data — each file targets its own index, so load them concurrently
+    jobs = [
+        (settings.index_entities, "companies.json", "entity_id"),
+        (settings.index_executives, "executives.json", "person_id"),
+        (settings.index_legal, "legal_cases.json", "case_id"),
+        (settings.index_news, "news.json", "article_id"),
+    ]
+    counts = await asyncio.gather(*[
+        load_json_file(es, index, os.path.join(DATA_DIR, filename), id_field)
+        for index, filename, id_field in jobs
+    ])
+    total = sum(counts)
 
     print("=" * 50)
     print(f"Demo data loaded: {total} total records")
@@ -3,138 +3,231 @@ Embed news articles with Gemini embedding API for kNN vector search.
 Run this after ingest_all.py to populate content_vector fields.
 """
 import asyncio
+import hashlib
+import itertools
+import sqlite3
 import sys
 import os
+from array import array
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from google import genai
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import async_bulk
+from src.elasticsearch.vector_search import get_embeddings, quantize_int8
 from config import get_settings
 
 settings = get_settings()
-gemini = genai.Client(api_key=settings.anthropic_api_key)
 
+# Max in-flight embedding calls
+EMBED_CONCURRENCY = 16
+# Texts sent per Gemini embed_content request
+EMBED_BATCH_SIZE = 100
+# Docs fetched per search_after page
+PAGE_SIZE = 1000
+
+# Local text-hash -> vector cache so re-runs skip Gemini for text already embedded
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "embeddings.sqlite")
+_cache: sqlite3.Connection | None = None
+
+# HTTP connections per ES node; sized so bulk writes never queue behind the pool
+ES_CONNECTIONS = 64
+
+_es: AsyncElasticsearch | None = None
+
+
+def get_es() -> AsyncElasticsearch:
+    """Return the script's single shared Elasticsearch client."""
+    global _es
+    if _es is None:
+        # gzip request bodies — the bulk vector updates compress well
+        options = dict(
+            node_class="aiohttp",
+            connections_per_node=ES_CONNECTIONS,
+            http_compress=True,
+            request_timeout=30,
+            retry_on_timeout=True,
+            max_retries=3,
+        )
+        if settings.es_api_key:
+            _es = AsyncElasticsearch(settings.es_url, api_key=settings.es_api_key, **options)
+        else:
+            _es = AsyncElasticsearch(
+                settings.es_url,
+                basic_auth=(settings.es_username, settings.es_password),
+                # Self-signed local clusters only; verify certs everywhere else
+                verify_certs=settings.app_env != "development",
+                **options,
+            )
+    return _es
 
-def get_es():
-    if settings.es_api_key:
-        return AsyncElasticsearch(settings.es_url, api_key=settings.es_api_key)
-    return AsyncElasticsearch(
-        settings.es_url,
-        basic_auth=(settings.es_username, settings.es_password),
-        verify_certs=False,
-    )
 
+def _get_cache() -> sqlite3.Connection:
+    global _cache
+    if _cache is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        _cache = sqlite3.connect(CACHE_PATH)
+        _cache.execute("CREATE TABLE IF NOT EXISTS embeddings (hash TEXT PRIMARY KEY, vec BLOB)")
+    return _cache
 
-async def get_embedding(text: str) -> list[float]:
-    """Generate a 384-dim embedding using Gemini."""
-    result = await asyncio.to_thread(
-        gemini.models.embed_content,
-        model="gemini-embedding-001",
-        contents=text,
-        config=genai.types.EmbedContentConfig(output_dimensionality=384),
-    )
-    return result.embeddings[0].values
-
-
-async def embed_index(es, index: str, text_fields: list[str], vector_field: str):
-    """Embed all docs in an index that lack a vector."""
-    # Find docs without vectors
-    result = await es.search(
-        index=index,
-        body={
-            "query": {
-                "bool": {
-                    "must_not": {"exists": {"field": vector_field}}
-                }
-            },
-            "size": 200,
-            "_source": text_fields + ["article_id", "filing_id", "entity_id", "person_id"],
-        },
+
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def cache_get(text: str) -> list[float] | None:
+    row = _get_cache().execute(
+        "SELECT vec FROM embeddings WHERE hash = ?", (_text_hash(text),)
+    ).fetchone()
+    return array("f", row[0]).tolist() if row else None
+
+
+def cache_put(texts: list[str], vectors: list[list[float]]):
+    db = _get_cache()
+    db.executemany(
+        "INSERT OR IGNORE INTO embeddings (hash, vec) VALUES (?, ?)",
+        [(_text_hash(t), array("f", v).tobytes()) for t, v in zip(texts, vectors)],
     )
+    db.commit()
 
-    docs = result["hits"]["hits"]
-    total = len(docs)
-    if total == 0:
-        print(f"  {index}: All documents already have vectors")
+
+def _doc_text(src: dict, text_fields: list[str], limit: int = 500) -> str:
+    """Build the text to embed, truncating each field before joining rather than after."""
+    remaining = limit
+    parts = []
+    for f in text_fields:
+        v = src.get(f)
+        if not v:
+            continue
+        v = str(v)[:remaining]
+        parts.append(v)
+        remaining -= len(v) + 1
+        if remaining <= 0:
+            break
+    return " ".join(parts)
+
+
+async def _embed_docs(es, index: str, docs: list[dict], text_fields: list[str], vector_field: str,
+                      sem: asyncio.Semaphore) -> int:
+    """Embed one page of search hits and bulk-write the vectors back."""
+    pending = []
+    updates = []
+    for doc in docs:
+        src = doc["_source"]
+        text = _doc_text(src, text_fields)
+        cached = cache_get(text)
+        if cached is not None:
+            if (quantized := quantize_int8(cached)) is not None:
+                updates.append({"_op_type": "update", "_index": index, "_id": doc["_id"], "doc": {vector_field: quantized}})
+        else:
+            pending.append((doc["_id"], text))
+
+    async def _batch(batch: list[tuple[str, str]]) -> list[dict]:
+        async with sem:
+            try:
+                texts = [text for _, text in batch]
+                vectors = await get_embeddings(texts)
+            except Exception as e:
+                print(f"    Failed batch of {len(batch)} starting at {batch[0][0]}: {e}")
+                return []
+
+        cache_put(texts, vectors)
+
+        # An all-zero embedding can't be stored in a cosine field: leave that doc without one
+        return [
+            {"_op_type": "update", "_index": index, "_id": doc_id, "doc": {vector_field: quantized}}
+            for (doc_id, _), vector in zip(batch, vectors)
+            if (quantized := quantize_int8(vector)) is not None
+        ]
+
+    it = iter(pending)
+    batches = list(iter(lambda: list(itertools.islice(it, EMBED_BATCH_SIZE)), []))
+    results = await asyncio.gather(*[_batch(b) for b in batches])
+    updates.extend(action for batch in results for action in batch)
+    if not updates:
         return 0
 
-    print(f"  {index}: Embedding {total} documents...")
-    count = 0
+    # Write all vectors back in _bulk requests instead of one update per doc
+    success, errors = await async_bulk(es, updates, chunk_size=200, raise_on_error=False)
+    if errors:
+        print(f"    {len(errors)} vector updates failed")
+    return success
 
-    for i, doc in enumerate(docs):
-        src = doc["_source"]
-        # Build text from available fields
-        text_parts = [str(src.get(f, "")) for f in text_fields if src.get(f)]
-        text = " ".join(text_parts)[:500]
-        if not text.strip():
-            continue
 
-        try:
-            vector = await get_embedding(text)
-            await es.update(
-                index=index,
-                id=doc["_id"],
-                body={"doc": {vector_field: vector}},
+async def embed_index(es, index: str, text_fields: list[str], vector_field: str, sem: asyncio.Semaphore):
+    """
+    Embed all docs in an index that lack a vector.
+    `sem` is shared across indices; get_embeddings applies the process-wide Gemini rate limit.
+    """
+    count = 0
+    seen = 0
+    search_after = None
+
+    # Walk every doc without a vector using a point-in-time + search_after
+    pit = await es.open_point_in_time(index=index, keep_alive="5m")
+    pit_id = pit["id"]
+    try:
+        while True:
+            result = await es.search(
+                pit={"id": pit_id, "keep_alive": "5m"},
+                query={
+                    "bool": {
+                        "must_not": {"exists": {"field": vector_field}},
+                        # Only return docs that have some text to embed
+                        "should": [{"wildcard": {f: "?*"}} for f in text_fields],
+                        "minimum_should_match": 1,
+                    }
+                },
+                sort=[{"_shard_doc": "asc"}],
+                search_after=search_after,
+                size=PAGE_SIZE,
+                source=text_fields,
             )
-            count += 1
-            if (i + 1) % 10 == 0:
-                print(f"    Progress: {i + 1}/{total}")
-            # Rate limit
-            await asyncio.sleep(0.15)
-        except Exception as e:
-            print(f"    Failed {doc['_id']}: {e}")
-            await asyncio.sleep(1)
-
+            pit_id = result.get("pit_id", pit_id)
+            docs = result["hits"]["hits"]
+            if not docs:
+                break
+
+            if seen == 0:
+                print(f"  {index}: Embedding documents...")
+            seen += len(docs)
+            count += await _embed_docs(es, index, docs, text_fields, vector_field, sem)
+            print(f"    Progress: {count} embedded / {seen} scanned")
+            search_after = docs[-1]["sort"]
+    finally:
+        await es.close_point_in_time(id=pit_id)
+
+    if seen == 0:
+        print(f"  {index}: All documents already have vectors")
     return count
 
 
+# (label, index, text fields, vector field)
+EMBED_TARGETS = [
+    ("News", "meridian-news", ["title", "content"], "content_vector"),
+    ("Legal", "meridian-legal", ["case_name", "case_summary"], "summary_vector"),
+    ("Filings", "meridian-filings", ["title", "content_summary"], "content_vector"),
+    ("Entities", "meridian-entities", ["name"], "name_vector"),
+    ("Executives", "meridian-executives", ["full_name", "bio_summary"], "name_vector"),
+]
+
+
 async def main():
     es = get_es()
     print("MERIDIAN — Vector Embedding Pipeline")
     print("=" * 50)
 
-    # Embed news articles
-    news_count = await embed_index(
-        es, "meridian-news",
-        text_fields=["title", "content"],
-        vector_field="content_vector",
-    )
-    print(f"  News: {news_count} documents embedded")
-
-    # Embed legal cases
-    legal_count = await embed_index(
-        es, "meridian-legal",
-        text_fields=["case_name", "case_summary"],
-        vector_field="summary_vector",
-    )
-    print(f"  Legal: {legal_count} documents embedded")
-
-    # Embed filings
-    filings_count = await embed_index(
-        es, "meridian-filings",
-        text_fields=["title", "content_summary"],
-        vector_field="content_vector",
-    )
-    print(f"  Filings: {filings_count} documents embedded")
+    # One semaphore for all indices, so they run concurrently within the shared rate limit
+    sem = asyncio.Semaphore(EMBED_CONCURRENCY)
 
-    # Embed entities
-    entity_count = await embed_index(
-        es, "meridian-entities",
-        text_fields=["name"],
-        vector_field="name_vector",
-    )
-    print(f"  Entities: {entity_count} documents embedded")
-
-    # Embed executives
-    exec_count = await embed_index(
-        es, "meridian-executives",
-        text_fields=["full_name", "bio_summary"],
-        vector_field="name_vector",
-    )
-    print(f"  Executives: {exec_count} documents embedded")
+    counts = await asyncio.gather(*[
+        embed_index(es, index, text_fields, vector_field, sem)
+        for _, index, text_fields, vector_field in EMBED_TARGETS
+    ])
+    for (label, *_), count in zip(EMBED_TARGETS, counts):
+        print(f"  {label}: {count} documents embedded")
 
-    total = news_count + legal_count + filings_count + entity_count + exec_count
+    total = sum(counts)
     print(f"\nTotal: {total} documents embedded across all indices")
 
     await es.close()
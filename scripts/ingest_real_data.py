@@ -17,12 +17,16 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config import get_settings
+from src.elasticsearch.bulk import BulkBuffer
 from src.elasticsearch.client import get_es_client, close_es_client
-from src.elasticsearch.indices import create_all_indices
+from src.elasticsearch.indices import create_all_indices, bulk_ingest_mode
 from src.ingestion.sec_edgar import ingest_company as ingest_sec
 from src.ingestion.gdelt_news import ingest_company_news
 from src.ingestion.court_listener import ingest_company_cases
 from src.ingestion.sanctions import ingest_ofac_sanctions
+from src.ingestion.http import close_http_client
+from src.ingestion.runtime import use_uvloop
 
 
 async def main():
@@ -43,27 +47,49 @@ async def main():
 
     await create_all_indices(es)
 
-    if args.sanctions:
-        print("Loading OFAC sanctions list (this may take a few minutes)...")
-        await ingest_ofac_sanctions()
+    settings = get_settings()
+    data_indices = [settings.index_entities, settings.index_executives, settings.index_filings,
+                    settings.index_legal, settings.index_news]
+    # One bulk buffer for every source, so docs go out in _bulk requests
+    buffer = BulkBuffer(es)
+    try:
+        async with bulk_ingest_mode(es, data_indices):
+            try:
+                if args.sanctions:
+                    print("Loading OFAC sanctions list (this may take a few minutes)...")
+                    await ingest_ofac_sanctions(buffer=buffer)
 
-    if args.company:
-        entity_id = args.entity_id or f"manual-{args.company.lower().replace(' ', '-')}"
-        print(f"\nIngesting data for: {args.company}")
+                if args.company:
+                    entity_id = args.entity_id or f"manual-{args.company.lower().replace(' ', '-')}"
+                    print(f"\nIngesting data for: {args.company}")
 
-        if args.cik:
-            print("  SEC EDGAR...")
-            await ingest_sec(args.company, args.cik)
+                    # Independent upstream APIs: fetch from all of them concurrently (over the shared HTTP client)
+                    sources = {}
+                    if args.cik:
+                        print("  SEC EDGAR...")
+                        sources["SEC EDGAR"] = ingest_sec(args.company, args.cik, buffer=buffer)
 
-        print("  GDELT News...")
-        await ingest_company_news(args.company, entity_id)
+                    print("  GDELT News...")
+                    sources["GDELT News"] = ingest_company_news(args.company, entity_id, buffer=buffer)
 
-        print("  CourtListener...")
-        await ingest_company_cases(args.company, entity_id)
+                    print("  CourtListener...")
+                    sources["CourtListener"] = ingest_company_cases(args.company, entity_id, buffer=buffer)
 
-    await close_es_client()
+                    # One failing source must not discard what the others fetched
+                    results = await asyncio.gather(*sources.values(), return_exceptions=True)
+                    for source, result in zip(sources, results):
+                        if isinstance(result, Exception):
+                            print(f"  {source} ingest failed: {result}")
+            finally:
+                await buffer.flush()
+                if buffer.errors:
+                    print(f"  {len(buffer.errors)} docs failed to index")
+    finally:
+        await close_http_client()
+        await close_es_client()
     print("\nIngestion complete!")
 
 
 if __name__ == "__main__":
+    use_uvloop()
     asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+AIMD (additive-increase / multiplicative-decrease) concurrency control for LLM calls.
+All agents share one controller, so the number of in-flight Gemini requests grows
+while the API keeps up and is cut back as soon as latency overruns or a 429 appears.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+
+class AIMDSemaphore:
+    def __init__(
+        self,
+        c_min: int = 1,
+        c_max: int = 16,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target: float = 20.0,
+        window: int = 20,
+        initial: int = 4,
+    ):
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.c_t = float(min(max(initial, c_min), c_max))  # current concurrency limit
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one concurrency slot for the duration of a call; records its latency on success."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.c_t))
+            self._in_flight += 1
+        start = time.monotonic()
+        try:
+            yield
+            self._record(time.monotonic() - start)
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def overload(self):
+        """Multiplicative decrease; call on a 429 / quota error."""
+        self.c_t = max(self.c_min, self.c_t * self.beta)
+
+    def _record(self, latency: float):
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) <= self.latency_target:
+            self.c_t = min(self.c_max, self.c_t + self.alpha)
+        else:
+            self.overload()
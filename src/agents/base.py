@@ -3,25 +3,104 @@ Base agent class for all Meridian agents.
 Each agent uses Gemini for reasoning + Elasticsearch for data retrieval.
 """
 import asyncio
-from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any
+import hashlib
+import random
+from abc import ABC
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable
+import orjson
+from aiolimiter import AsyncLimiter
+from pydantic import BaseModel, ValidationError
 from google import genai
+from google.genai import errors as genai_errors
+from src.agents.backpressure import AIMDSemaphore
 from src.elasticsearch.client import get_es_client
+from src.elasticsearch.queries import EsqlQuery
+from src.elasticsearch.vector_search import quantize_int8
 from config import get_settings
 
 settings = get_settings()
 
+# Limiters are per process, so each holds its worker's share of the budget (see run.py).
+# In-flight Gemini calls across all agents and investigations in this process
+_llm_limiter = AIMDSemaphore(
+    c_max=settings.per_worker(settings.gemini_max_concurrency),
+    latency_target=settings.gemini_latency_target,
+)
+# Token bucket for this process's share of the Gemini request quota
+_rate_limiter = AsyncLimiter(settings.per_worker(settings.gemini_generate_rpm), 60)
+_BACKOFF_BASE = 15.0  # seconds; full-jitter backoff when no Retry-After is given
 
+
+_GEMINI_CLIENT: genai.Client | None = None
+
+
+def _get_gemini() -> genai.Client:
+    """One Gemini client (and HTTP connection pool) shared by every agent instance."""
+    global _GEMINI_CLIENT
+    if _GEMINI_CLIENT is None:
+        _GEMINI_CLIENT = genai.Client(api_key=settings.anthropic_api_key)
+    return _GEMINI_CLIENT
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Seconds from a Retry-After header on the error's HTTP response, if present."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Rate limits (429) and server-side errors are retried; other client errors are not."""
+    if isinstance(exc, genai_errors.ClientError):
+        return exc.code == 429
+    return isinstance(exc, genai_errors.ServerError)
+
+
+def _quota_nearly_spent(headers) -> bool:
+    """True when rate-limit headers report under 10% of the request quota left."""
+    try:
+        remaining = float(headers["x-ratelimit-remaining-requests"])
+        limit = float(headers["x-ratelimit-limit-requests"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return remaining < 0.1 * limit
+
+
+# A planned Elasticsearch request: an ES|QL query, or an (index, search body) pair
+Request = EsqlQuery | tuple[str, dict]
+
+
+@lru_cache(maxsize=32)
+def _generation_config(system_prompt: str) -> genai.types.GenerateContentConfig:
+    """Request config per system prompt, built once; agents' prompts are static module constants."""
+    return genai.types.GenerateContentConfig(
+        system_instruction=system_prompt,
+        response_mime_type="application/json",
+    )
+
+
+class AgentResult(BaseModel):
+    """Response schema every specialist agent asks Gemini for."""
+    findings: str
+    risk_score: float
+    red_flags: list[str]
+
+
+@dataclass(slots=True)
 class AgentFinding:
-    def __init__(self, agent_name: str):
-        self.agent_name = agent_name
-        self.status = "running"
-        self.findings: str = ""
-        self.risk_contribution: float = 0.0
-        self.red_flags: list[str] = []
-        self.raw_data: dict = {}
-        self.completed_at: datetime | None = None
+    agent_name: str
+    status: str = "running"
+    findings: str = ""
+    risk_contribution: float = 0.0
+    red_flags: list[str] = field(default_factory=list)
+    raw_data: dict = field(default_factory=dict)
+    completed_at: datetime | None = None
+    full_result: dict = field(default_factory=dict)  # Risk Synthesis's complete parsed response
 
     def complete(self, findings: str, risk_score: float, red_flags: list[str]):
         self.findings = findings
@@ -49,50 +128,222 @@ class AgentFinding:
 class BaseAgent(ABC):
     """
     Base class for all Meridian agents.
-    Subclasses implement `run()` which:
-      1. Queries Elasticsearch for relevant data
+    Specialist agents set `system_prompt` / `task` and either implement `plan()` + `analyze()`
+    (so their requests can be batched with other agents') or override `collect()`; `run()` then:
+      1. Queries Elasticsearch for relevant data (`collect`)
       2. Passes structured data to Gemini for reasoning
       3. Returns an AgentFinding
+    Agents with a different flow (e.g. Risk Synthesis) override `run()` directly.
     """
 
+    system_prompt: str = ""
+    task: str = "Analyze"  # user-message lead-in, followed by the quoted target
+
     def __init__(self, name: str):
         self.name = name
-        self.es = get_es_client()
-        self.gemini = genai.Client(api_key=settings.anthropic_api_key)
 
-    @abstractmethod
+    # Agents hold no per-investigation state, so one instance of each serves every
+    # request; clients are resolved per use so a restarted ES client is picked up
+    @property
+    def es(self):
+        return get_es_client()
+
+    @property
+    def gemini(self) -> genai.Client:
+        return _get_gemini()
+
+    def plan(self, target: str, context: dict) -> list[Request]:
+        """The Elasticsearch requests `analyze()` needs, in the order it expects their results."""
+        raise NotImplementedError
+
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        """Build the evidence dict from `plan()`'s results (ES|QL rows or search hits, in plan order)."""
+        raise NotImplementedError
+
+    async def collect(self, target: str, context: dict) -> dict | None:
+        """Gather this agent's evidence from Elasticsearch. None means there is nothing to analyze."""
+        return self.analyze(target, context, await self._fetch(self.plan(target, context)))
+
+    def complete_without_data(self, finding: AgentFinding, target: str):
+        """Resolve the finding when `collect()` found nothing."""
+        finding.complete(findings=f"No relevant records found for '{target}'.", risk_score=0.0, red_flags=[])
+
+    def prompt(self, target: str, data: dict) -> str:
+        # Compact JSON: indentation only adds prompt tokens
+        return f"{self.task} '{target}':\n\n{orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()}"
+
     async def run(self, target: str, context: dict) -> AgentFinding:
         """Execute the agent investigation."""
-        ...
+        finding = AgentFinding(self.name)
+        try:
+            data = await self.collect(target, context)
+            if data is None:
+                self.complete_without_data(finding, target)
+                return finding
+
+            response = await self._ask_llm(
+                self.system_prompt, self.prompt(target, data), validate=AgentResult.model_validate_json,
+            )
+
+            result = AgentResult.model_validate_json(response)
+            finding.raw_data = data
+            finding.complete(
+                findings=result.findings,
+                risk_score=result.risk_score,
+                red_flags=result.red_flags,
+            )
 
-    async def _ask_llm(self, system_prompt: str, user_message: str) -> str:
-        """Send a reasoning request to Gemini with automatic retry on rate limits."""
+        except Exception as e:
+            finding.fail(str(e))
+
+        return finding
+
+    async def _ask_llm(
+        self,
+        system_prompt: str,
+        user_message: str,
+        validate: Callable[[str], Any] | None = None,
+        on_token: Callable[[str], Any] | None = None,
+        on_reset: Callable[[], Any] | None = None,
+    ) -> str:
+        """
+        Send a reasoning request to Gemini, serving identical prompts from the ES cache.
+        The user message embeds the agent's retrieved data, so a hit means the same evidence.
+
+        If `validate` is given (e.g. a pydantic `model_validate_json`), an invalid response
+        gets one repair round that shows Gemini its output and the error, instead of failing
+        the agent outright. Only validated responses are cached.
+
+        `on_token` receives the response text as it streams in (a cache hit arrives in one
+        piece). It is a live preview; the returned string is the authoritative response.
+        `on_reset` is called when a retry discards text already sent to `on_token`, so the
+        preview can be cleared before the new attempt streams from the start.
+        """
+        # The key is the exact prompt text, so agents build it deterministically (e.g. sets
+        # sorted): identical evidence must yield an identical prompt to hit the cache
+        key = hashlib.sha256(
+            f"{settings.gemini_model}\x00{system_prompt}\x00{user_message}".encode()
+        ).hexdigest()
+        cached = await self._cache_get(key)
+        if cached is not None:
+            if on_token is not None:
+                on_token(cached)
+            return cached
+        response = await self._generate(system_prompt, user_message, on_token, on_reset)
+        if validate is not None:
+            try:
+                validate(response)
+            except ValidationError as e:
+                print(f"  [{self.name}] Invalid LLM response, requesting a repair")
+                response = await self._generate(
+                    system_prompt,
+                    f"{user_message}\n\nYour previous response did not match the required JSON format:\n"
+                    f"{response}\n\nValidation errors:\n{e}\n\n"
+                    "Reply with only the corrected JSON object.",
+                )
+                validate(response)
+        await self._cache_put(key, response)
+        return response
+
+    async def _cache_get(self, key: str) -> str | None:
+        """Cached response for this prompt key, or None on miss / expiry / error."""
+        if not settings.llm_cache_ttl_hours:
+            return None
+        try:
+            doc = await self.es.options(ignore_status=404).get(index=settings.index_llm_cache, id=key)
+        except Exception as e:
+            print(f"  [{self.name}] LLM cache lookup error (non-fatal): {e}")
+            return None
+        if not doc.get("found"):
+            return None
+        src = doc["_source"]
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(src["cached_at"])
+        if age > timedelta(hours=settings.llm_cache_ttl_hours):
+            return None
+        return src["response"]
+
+    async def _cache_put(self, key: str, response: str):
+        if not settings.llm_cache_ttl_hours:
+            return
+        try:
+            await self.es.index(
+                index=settings.index_llm_cache,
+                id=key,
+                document={
+                    "agent_name": self.name,
+                    "model": settings.gemini_model,
+                    "response": response,
+                    "cached_at": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        except Exception as e:
+            print(f"  [{self.name}] LLM cache write error (non-fatal): {e}")
+
+    async def _generate(
+        self,
+        system_prompt: str,
+        user_message: str,
+        on_token: Callable[[str], Any] | None = None,
+        on_reset: Callable[[], Any] | None = None,
+    ) -> str:
+        """Call Gemini with automatic retry on rate limits (see `_ask_llm` for the callbacks)."""
         max_retries = 4
         for attempt in range(max_retries):
+            parts, chunk = [], None
             try:
-                response = await asyncio.to_thread(
-                    self.gemini.models.generate_content,
-                    model=settings.gemini_model,
-                    contents=user_message,
-                    config=genai.types.GenerateContentConfig(
-                        system_instruction=system_prompt,
-                        response_mime_type="application/json",
-                    ),
-                )
-                return response.text
-            except Exception as e:
-                if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                    wait = (attempt + 1) * 15  # 15s, 30s, 45s, 60s
-                    print(f"  [{self.name}] Rate limited, retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait)
-                else:
+                async with _rate_limiter, _llm_limiter.slot():
+                    # Native async streaming: no worker thread held for the whole completion,
+                    # and chunks are consumed as they arrive
+                    async for chunk in await self.gemini.aio.models.generate_content_stream(
+                        model=settings.gemini_model,
+                        contents=user_message,
+                        config=_generation_config(system_prompt),
+                    ):
+                        if chunk.text:
+                            parts.append(chunk.text)
+                            if on_token is not None:
+                                on_token(chunk.text)
+                # Back off before the quota runs out rather than after the first 429
+                http = getattr(chunk, "sdk_http_response", None)
+                if http is not None and _quota_nearly_spent(http.headers or {}):
+                    _llm_limiter.overload()
+                return "".join(parts)
+            except genai_errors.APIError as e:
+                if not _is_retryable(e):
                     raise
-        raise Exception(f"Gemini rate limit exceeded after {max_retries} retries")
+                _llm_limiter.overload()
+                if attempt == max_retries - 1:
+                    raise  # out of retries: surface the last error, status code included
+                # The retry streams from the first token again: drop the partial preview
+                if parts and on_token is not None and on_reset is not None:
+                    on_reset()
+                wait = _retry_after(e)
+                if wait is None:
+                    wait = random.uniform(0, _BACKOFF_BASE * 2 ** attempt)  # full jitter
+                print(f"  [{self.name}] Gemini {e.code}, retrying in {wait:.1f}s (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait)
+
+    async def _fetch(self, requests: list[Request]) -> list[list[dict]]:
+        """
+        Execute planned requests: every search goes out in one _msearch, concurrently
+        with the ES|QL queries. Returns one result list per request, in order.
+        """
+        searches = [r for r in requests if isinstance(r, tuple)]
+        queries = [r for r in requests if not isinstance(r, tuple)]
+        hits, rows = await asyncio.gather(
+            self._msearch(searches),
+            asyncio.gather(*[self._run_esql(q) for q in queries]),
+        )
+        hits, rows = iter(hits), iter(rows)
+        return [next(hits) if isinstance(r, tuple) else next(rows) for r in requests]
 
-    async def _run_esql(self, query: str) -> list[dict]:
+    async def _run_esql(self, query: EsqlQuery) -> list[dict]:
         """Execute an ES|QL query and return rows as list of dicts. Returns [] on error."""
+        body = {"query": query.query}
+        if query.filter is not None:
+            body["filter"] = query.filter
         try:
-            result = await self.es.esql.query(body={"query": query})
+            result = await self.es.esql.query(body=body)
             columns = [col["name"] for col in result.get("columns", [])]
             rows = result.get("values", [])
             return [dict(zip(columns, row)) for row in rows]
@@ -100,21 +351,75 @@ class BaseAgent(ABC):
             print(f"  [{self.name}] ES|QL query error (non-fatal): {e}")
             return []
 
-    async def _search(self, index: str, body: dict) -> list[dict]:
-        """Run an Elasticsearch search and return hits. Returns [] on error."""
+    async def _search(self, index: str, body: dict, source_includes: list[str] | None = None) -> list[dict]:
+        """
+        Run an Elasticsearch search and return hits. Returns [] on error.
+        `source_includes` limits each hit's _source to the fields the caller reads.
+        """
         try:
-            result = await self.es.search(index=index, body=body)
+            result = await self.es.search(
+                index=index,
+                body=body,
+                source_includes=source_includes,
+                request_cache=True if body.get("size") == 0 else None,
+            )
             return [hit["_source"] for hit in result["hits"]["hits"]]
         except Exception as e:
             print(f"  [{self.name}] Search error (non-fatal): {e}")
             return []
 
+    async def _aggregate(self, index: str, body: dict) -> tuple[int, dict]:
+        """
+        Run a hits-free (size=0) search and return (total hit count, aggregations).
+        Returns (0, {}) on error.
+        """
+        try:
+            # Hits-free responses are deterministic per query: serve repeats from the shard request cache
+            result = await self.es.search(
+                index=index, body={**body, "size": 0, "track_total_hits": True}, request_cache=True,
+            )
+            return result["hits"]["total"]["value"], result.get("aggregations", {})
+        except Exception as e:
+            print(f"  [{self.name}] Aggregation error (non-fatal): {e}")
+            return 0, {}
+
+    async def _msearch(self, items: list[tuple[str, dict]]) -> list[list[dict]]:
+        """
+        Run several independent searches in one _msearch round-trip.
+        Returns one hit-source list per (index, body) item; a failed item yields [].
+        """
+        if not items:
+            return []
+        searches = []
+        for index, body in items:
+            header = {"index": index}
+            if body.get("size") == 0:
+                header["request_cache"] = True
+            searches.append(header)
+            searches.append(body)
+        try:
+            result = await self.es.msearch(searches=searches)
+        except Exception as e:
+            print(f"  [{self.name}] Multi-search error (non-fatal): {e}")
+            return [[] for _ in items]
+        out = []
+        for resp in result["responses"]:
+            if "error" in resp:
+                print(f"  [{self.name}] Search error (non-fatal): {resp['error']}")
+                out.append([])
+            else:
+                out.append([hit["_source"] for hit in resp["hits"]["hits"]])
+        return out
+
     async def _knn_search(self, index: str, vector: list[float], field: str, k: int = 5) -> list[dict]:
-        """Run a kNN vector search."""
+        """Run a kNN vector search (an all-zero embedding matches nothing)."""
+        query_vector = quantize_int8(vector)
+        if query_vector is None:
+            return []
         try:
             result = await self.es.search(
                 index=index,
-                knn={"field": field, "query_vector": vector, "k": k, "num_candidates": 50},
+                knn={"field": field, "query_vector": query_vector, "k": k, "num_candidates": 50},
             )
             return [hit["_source"] for hit in result["hits"]["hits"]]
         except Exception as e:
@@ -0,0 +1,113 @@
+"""
+Composite Analyst
+Runs several specialist agents' data collection as one batch, then reasons over
+all of their evidence in a single Gemini call instead of one call per agent.
+Each section of the fused response is written back to that agent's AgentFinding.
+"""
+import asyncio
+from typing import Any
+import orjson
+from pydantic import TypeAdapter
+from src.agents.base import BaseAgent, AgentFinding, AgentResult
+
+SYSTEM_PROMPT = """You are MERIDIAN's Composite Analyst. You perform the work of several specialist
+agents at once. The input is a JSON object with one section per agent, keyed by agent name.
+Analyze each section strictly in the role described for that agent below, using only that
+section's data.
+
+{roles}
+
+Ignore the per-role response formats above. Respond with ONE JSON object that has exactly one
+key per input section (same names), each mapping to:
+{{
+  "findings": "Clear 2-3 paragraph narrative for that section",
+  "risk_score": <float 0.0-10.0>,
+  "red_flags": ["flag1", "flag2", ...]
+}}
+"""
+
+
+# Fused response: one AgentResult per section, keyed by agent name
+_SECTIONS = TypeAdapter(dict[str, AgentResult])
+
+
+class CompositeAgent(BaseAgent):
+    def __init__(self, agents: list[BaseAgent]):
+        super().__init__("Composite Analyst")
+        self.agents = agents
+
+    async def collect_all(self, target: str, context: dict) -> list:
+        """
+        Evidence for every agent, in order (an Exception where collection failed).
+        All agents' planned requests go out as one batch: a single _msearch plus the
+        ES|QL queries alongside it. Agents without a plan collect on their own.
+        """
+        plans: dict[BaseAgent, list] = {}
+        solo: list[BaseAgent] = []
+        for agent in self.agents:
+            try:
+                plans[agent] = agent.plan(target, context)
+            except NotImplementedError:
+                solo.append(agent)
+
+        fetched, solo_data = await asyncio.gather(
+            self._fetch([r for requests in plans.values() for r in requests]),
+            asyncio.gather(*[agent.collect(target, context) for agent in solo], return_exceptions=True),
+        )
+
+        collected: dict[BaseAgent, Any] = dict(zip(solo, solo_data))
+        offset = 0
+        for agent, requests in plans.items():
+            results = fetched[offset:offset + len(requests)]
+            offset += len(requests)
+            try:
+                collected[agent] = agent.analyze(target, context, results)
+            except Exception as e:
+                collected[agent] = e
+        return [collected[agent] for agent in self.agents]
+
+    async def run_all(self, target: str, context: dict) -> list[AgentFinding]:
+        """Collect for every agent concurrently, then resolve all findings from one LLM call."""
+        findings = [AgentFinding(agent.name) for agent in self.agents]
+        collected = await self.collect_all(target, context)
+
+        pending: list[tuple[BaseAgent, AgentFinding]] = []
+        sections: dict[str, dict] = {}
+        for agent, finding, data in zip(self.agents, findings, collected):
+            if isinstance(data, Exception):
+                finding.fail(str(data))
+            elif data is None:
+                agent.complete_without_data(finding, target)
+            else:
+                finding.raw_data = data
+                sections[agent.name] = data
+                pending.append((agent, finding))
+
+        if not pending:
+            return findings
+
+        roles = "\n\n".join(f"## {agent.name}\n{agent.system_prompt}" for agent, _ in pending)
+        try:
+            response = await self._ask_llm(
+                SYSTEM_PROMPT.format(roles=roles),
+                f"Analyze each section for '{target}':\n\n{orjson.dumps(sections, option=orjson.OPT_NON_STR_KEYS).decode()}",
+                validate=_SECTIONS.validate_json,
+            )
+            result = _SECTIONS.validate_json(response)
+        except Exception as e:
+            for _, finding in pending:
+                finding.fail(str(e))
+            return findings
+
+        for agent, finding in pending:
+            section = result.get(agent.name)
+            if section is None:
+                finding.fail("Missing section in composite response")
+                continue
+            finding.complete(
+                findings=section.findings,
+                risk_score=section.risk_score,
+                red_flags=section.red_flags,
+            )
+
+        return findings
@@ -0,0 +1,43 @@
+"""
+Investigation Context
+Per-investigation state shared between agents. Entity Discovery resolves the
+target once and records it here, so downstream agents read the primary entity
+and its subsidiary footprint instead of re-querying the entities index.
+"""
+
+
+class InvestigationContext(dict):
+    """
+    A dict (agents keep using `context.get(...)`) with the entity lookup memoized:
+
+        entity_id                  primary entity's id ("" until resolved)
+        primary_entity             primary entity record, or None
+        subsidiary_jurisdictions   {jurisdiction: subsidiary count}
+        jurisdictions              set of the primary's and all subsidiaries' jurisdictions
+        entity_names               primary entity's name and aliases
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setdefault("entity_id", "")
+        self.setdefault("primary_entity", None)
+        self.setdefault("subsidiary_jurisdictions", {})
+        self.setdefault("jurisdictions", set())
+        self.setdefault("entity_names", [])
+
+    def set_primary(self, primary: dict, subsidiary_jurisdictions: dict[str, int]):
+        jurisdictions = set(subsidiary_jurisdictions)
+        if primary.get("jurisdiction"):
+            jurisdictions.add(primary["jurisdiction"])
+        self.update(
+            entity_id=primary.get("entity_id", ""),
+            primary_entity=primary,
+            subsidiary_jurisdictions=subsidiary_jurisdictions,
+            jurisdictions=jurisdictions,
+            entity_names=[n for n in [primary.get("name"), *(primary.get("aliases") or [])] if n],
+        )
+
+    @staticmethod
+    def names_for(target: str, context: dict) -> list[str]:
+        """The target as typed plus the resolved entity's names, for entity_name_filter."""
+        return [target, *context.get("entity_names", [])]
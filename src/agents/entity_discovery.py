@@ -3,13 +3,28 @@ Agent 1: Entity Discovery
 Finds a company and maps its full corporate ownership structure.
 Discovers subsidiaries, parent companies, shell companies, and related entities.
 """
-import json
+import asyncio
 from src.agents.base import BaseAgent, AgentFinding
+from src.agents.context import InvestigationContext
 from src.elasticsearch.queries import hybrid_entity_search
 from config import get_settings
 
 settings = get_settings()
 
+HIGH_RISK_JURISDICTIONS = frozenset({
+    "BVI", "Cayman Islands", "Panama", "Marshall Islands",
+    "Seychelles", "Belize", "Vanuatu", "Mauritius", "Samoa",
+})
+
+# Static part of the subsidiary summary request; only the query varies per target
+_SUBSIDIARY_AGGS = {
+    "by_jurisdiction": {"terms": {"field": "jurisdiction", "size": 50}},
+    "status_counts": {"terms": {"field": "status"}},
+}
+_PRIMARY_FIELDS = ["entity_id", "name", "aliases", "jurisdiction", "country_code",
+                   "incorporation_date", "status", "entity_type"]
+_SUBSIDIARY_FIELDS = ["name", "jurisdiction", "status"]
+
 SYSTEM_PROMPT = """You are MERIDIAN's Entity Discovery Agent. Your role is to analyze corporate ownership
 structure data and identify risks in how a company is organized.
 
@@ -29,84 +44,84 @@ Respond with a JSON object:
 
 
 class EntityDiscoveryAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze this corporate structure for"
+
     def __init__(self):
         super().__init__("Entity Discovery")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            # Step 1: Find the primary entity
-            primary_results = await self._search(
+    async def collect(self, target: str, context: dict) -> dict | None:
+        # Step 1: Find the primary entity
+        primary_results = await self._search(
+            settings.index_entities,
+            hybrid_entity_search(target, size=5),
+            source_includes=_PRIMARY_FIELDS,
+        )
+
+        if not primary_results:
+            return None
+
+        primary = primary_results[0]
+        entity_id = primary.get("entity_id", "")
+
+        # Step 2: Summarize subsidiaries with aggregations (exact count, jurisdictions,
+        # statuses) and fetch only a small sample of them for the narrative
+        subsidiary_query = {"term": {"parent_entity_id": entity_id}}
+        (total_subsidiaries, aggs), subsidiaries = await asyncio.gather(
+            self._aggregate(
                 settings.index_entities,
-                hybrid_entity_search(target, size=5),
-            )
-
-            if not primary_results:
-                finding.complete(
-                    findings=f"No corporate registration records found for '{target}' in our database.",
-                    risk_score=2.0,
-                    red_flags=["No corporate records found"],
-                )
-                return finding
-
-            primary = primary_results[0]
-            entity_id = primary.get("entity_id", "")
-
-            # Step 2: Find subsidiaries
-            subsidiaries = await self._search(
+                {"query": subsidiary_query, "aggs": _SUBSIDIARY_AGGS},
+            ),
+            self._search(
                 settings.index_entities,
+                {"query": subsidiary_query, "size": 10},
+                source_includes=_SUBSIDIARY_FIELDS,
+            ),
+        )
+
+        # Step 3: Count jurisdictions and flag high-risk ones
+        subsidiary_jurisdictions = {
+            b["key"]: b["doc_count"] for b in aggs.get("by_jurisdiction", {}).get("buckets", [])
+        }
+        jurisdictions = set(subsidiary_jurisdictions)
+        if primary.get("jurisdiction"):
+            jurisdictions.add(primary["jurisdiction"])
+
+        # Share the resolved entity with downstream agents
+        if isinstance(context, InvestigationContext):
+            context.set_primary(primary, subsidiary_jurisdictions)
+
+        high_risk_jurs = jurisdictions & HIGH_RISK_JURISDICTIONS
+
+        corporate_data = {
+            "primary_entity": {
+                "name": primary.get("name"),
+                "jurisdiction": primary.get("jurisdiction"),
+                "incorporation_date": primary.get("incorporation_date"),
+                "status": primary.get("status"),
+                "entity_type": primary.get("entity_type"),
+            },
+            "total_subsidiaries": total_subsidiaries,
+            "subsidiary_status_counts": {
+                b["key"]: b["doc_count"] for b in aggs.get("status_counts", {}).get("buckets", [])
+            },
+            "all_jurisdictions": sorted(jurisdictions),
+            "high_risk_jurisdictions": sorted(high_risk_jurs),
+            "subsidiary_sample": [
                 {
-                    "query": {"term": {"parent_entity_id": entity_id}},
-                    "size": 50,
-                },
-            )
-
-            # Step 3: Count jurisdictions and flag high-risk ones
-            HIGH_RISK_JURISDICTIONS = {
-                "BVI", "Cayman Islands", "Panama", "Marshall Islands",
-                "Seychelles", "Belize", "Vanuatu", "Mauritius", "Samoa",
-            }
-
-            all_entities = [primary] + subsidiaries
-            jurisdictions = [e.get("jurisdiction", "") for e in all_entities]
-            high_risk_jurs = [j for j in jurisdictions if j in HIGH_RISK_JURISDICTIONS]
-
-            corporate_data = {
-                "primary_entity": {
-                    "name": primary.get("name"),
-                    "jurisdiction": primary.get("jurisdiction"),
-                    "incorporation_date": primary.get("incorporation_date"),
-                    "status": primary.get("status"),
-                    "entity_type": primary.get("entity_type"),
-                },
-                "total_subsidiaries": len(subsidiaries),
-                "all_jurisdictions": list(set(jurisdictions)),
-                "high_risk_jurisdictions": list(set(high_risk_jurs)),
-                "subsidiary_sample": [
-                    {
-                        "name": s.get("name"),
-                        "jurisdiction": s.get("jurisdiction"),
-                        "status": s.get("status"),
-                    }
-                    for s in subsidiaries[:10]
-                ],
-            }
-
-            # Step 4: Claude analyzes the structure
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze this corporate structure for '{target}':\n\n{json.dumps(corporate_data, indent=2)}",
-            )
-
-            result = json.loads(response)
-            finding.raw_data = corporate_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
-
-        except Exception as e:
-            finding.fail(str(e))
-
-        return finding
+                    "name": s.get("name"),
+                    "jurisdiction": s.get("jurisdiction"),
+                    "status": s.get("status"),
+                }
+                for s in subsidiaries
+            ],
+        }
+
+        return corporate_data
+
+    def complete_without_data(self, finding: AgentFinding, target: str):
+        finding.complete(
+            findings=f"No corporate registration records found for '{target}' in our database.",
+            risk_score=2.0,
+            red_flags=["No corporate records found"],
+        )
@@ -3,8 +3,7 @@ Agent 4: Executive Background Agent
 Profiles key executives/directors, traces their history across companies,
 detects PEP status, prior failures, conflicts of interest.
 """
-import json
-from src.agents.base import BaseAgent, AgentFinding
+from src.agents.base import BaseAgent, Request
 from config import get_settings
 
 settings = get_settings()
@@ -31,72 +30,64 @@ Respond with a JSON object:
 
 
 class ExecutiveBackgroundAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze executive backgrounds for"
+
     def __init__(self):
         super().__init__("Executive Background")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            entity_id = context.get("entity_id", "")
-
-            # Step 1: Find executives linked to this entity
-            executives = await self._search(
-                settings.index_executives,
-                {
-                    "query": {
-                        "bool": {
-                            "should": [
-                                {"term": {"current_entity_id": entity_id}},
-                                {"match": {"employment_history.entity_name": target}},
-                            ],
-                            "minimum_should_match": 1,
-                        }
-                    },
-                    "size": 20,
-                },
-            )
+    def plan(self, target: str, context: dict) -> list[Request]:
+        entity_id = context.get("entity_id", "")
 
-            # Step 2: Flag high-risk executives
-            peps = [e for e in executives if e.get("is_pep")]
-            sanctioned = [e for e in executives if e.get("is_sanctioned")]
-            high_risk = [e for e in executives if (e.get("risk_score") or 0) >= 7.0]
-
-            exec_data = {
-                "company": target,
-                "executives_found": len(executives),
-                "pep_count": len(peps),
-                "sanctioned_count": len(sanctioned),
-                "high_risk_count": len(high_risk),
-                "executive_profiles": [
-                    {
-                        "name": e.get("full_name"),
-                        "title": e.get("current_title"),
-                        "is_pep": e.get("is_pep"),
-                        "is_sanctioned": e.get("is_sanctioned"),
-                        "risk_score": e.get("risk_score"),
-                        "risk_flags": e.get("risk_flags", []),
-                        "nationalities": e.get("nationalities", []),
-                        "employment_history": e.get("employment_history", [])[:5],
-                        "pep_details": e.get("pep_details"),
+        # Step 1: Find executives linked to this entity
+        return [(
+            settings.index_executives,
+            {
+                "query": {
+                    "bool": {
+                        "should": [
+                            {"term": {"current_entity_id": entity_id}},
+                            {"match": {"employment_history.entity_name": target}},
+                        ],
+                        "minimum_should_match": 1,
                     }
-                    for e in executives[:10]
-                ],
-            }
+                },
+                "_source": ["full_name", "current_title", "is_pep", "is_sanctioned", "risk_score",
+                            "risk_flags", "nationalities", "employment_history", "pep_details"],
+                "size": 20,
+            },
+        )]
 
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze executive backgrounds for '{target}':\n\n{json.dumps(exec_data, indent=2)}",
-            )
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        executives, = results
 
-            result = json.loads(response)
-            finding.raw_data = exec_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
+        # Step 2: Flag high-risk executives
+        pep_count = sanctioned_count = high_risk_count = 0
+        for e in executives:
+            pep_count += bool(e.get("is_pep"))
+            sanctioned_count += bool(e.get("is_sanctioned"))
+            high_risk_count += (e.get("risk_score") or 0) >= 7.0
 
-        except Exception as e:
-            finding.fail(str(e))
+        exec_data = {
+            "company": target,
+            "executives_found": len(executives),
+            "pep_count": pep_count,
+            "sanctioned_count": sanctioned_count,
+            "high_risk_count": high_risk_count,
+            "executive_profiles": [
+                {
+                    "name": e.get("full_name"),
+                    "title": e.get("current_title"),
+                    "is_pep": e.get("is_pep"),
+                    "is_sanctioned": e.get("is_sanctioned"),
+                    "risk_score": e.get("risk_score"),
+                    "risk_flags": e.get("risk_flags", []),
+                    "nationalities": e.get("nationalities", []),
+                    "employment_history": e.get("employment_history", [])[:5],
+                    "pep_details": e.get("pep_details"),
+                }
+                for e in executives[:10]
+            ],
+        }
 
-        return finding
+        return exec_data
@@ -5,8 +5,8 @@ Analyzes SEC filings and financial data for red flags:
 - Revenue/debt trends, deteriorating financials
 - Unusual related-party transactions
 """
-import json
-from src.agents.base import BaseAgent, AgentFinding
+from src.agents.base import BaseAgent, Request
+from src.agents.context import InvestigationContext
 from src.elasticsearch.queries import esql_financial_trend, esql_auditor_changes
 from config import get_settings
 
@@ -34,18 +34,19 @@ Respond with a JSON object:
 
 
 class FinancialSignalAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze the financial data for"
+
     def __init__(self):
         super().__init__("Financial Signal")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            # Step 1: Pull financial trend via ES|QL
-            trend_rows = await self._run_esql(esql_financial_trend(target))
-            auditor_rows = await self._run_esql(esql_auditor_changes(target))
-
-            # Step 2: Pull latest filings directly
-            filings = await self._search(
+    def plan(self, target: str, context: dict) -> list[Request]:
+        # Steps 1-2: ES|QL financial trend + auditor history, and the latest filings directly
+        names = InvestigationContext.names_for(target, context)
+        return [
+            esql_financial_trend(names),
+            esql_auditor_changes(names),
+            (
                 settings.index_filings,
                 {
                     "query": {
@@ -56,56 +57,45 @@ class FinancialSignalAgent(BaseAgent):
                         }
                     },
                     "sort": [{"filing_date": {"order": "desc"}}],
+                    "_source": ["filing_date", "filing_type", "revenue", "net_income", "total_debt",
+                                "auditor", "auditor_opinion", "going_concern", "restatement"],
                     "size": 10,
                 },
-            )
-
-            # Step 3: Compute quick metrics
-            going_concern_count = sum(1 for f in filings if f.get("going_concern"))
-            restatement_count = sum(1 for f in filings if f.get("restatement"))
-            qualified_opinions = [
-                f for f in filings
-                if f.get("auditor_opinion") not in ("clean", None)
-            ]
+            ),
+        ]
 
-            financial_data = {
-                "company": target,
-                "filings_analyzed": len(filings),
-                "going_concern_warnings": going_concern_count,
-                "restatements": restatement_count,
-                "non_clean_audit_opinions": len(qualified_opinions),
-                "financial_trend": trend_rows[:8] if trend_rows else "No financial trend data available",
-                "auditor_history": auditor_rows if auditor_rows else "No auditor history available",
-                "recent_filings": [
-                    {
-                        "date": f.get("filing_date"),
-                        "type": f.get("filing_type"),
-                        "revenue": f.get("revenue"),
-                        "net_income": f.get("net_income"),
-                        "total_debt": f.get("total_debt"),
-                        "auditor": f.get("auditor"),
-                        "opinion": f.get("auditor_opinion"),
-                        "going_concern": f.get("going_concern"),
-                        "restatement": f.get("restatement"),
-                    }
-                    for f in filings[:5]
-                ],
-            }
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        trend_rows, auditor_rows, filings = results
 
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze the financial data for '{target}':\n\n{json.dumps(financial_data, indent=2)}",
-            )
+        # Step 3: Compute quick metrics
+        going_concern_count = restatement_count = qualified_count = 0
+        for f in filings:
+            going_concern_count += bool(f.get("going_concern"))
+            restatement_count += bool(f.get("restatement"))
+            qualified_count += f.get("auditor_opinion") not in ("clean", None)
 
-            result = json.loads(response)
-            finding.raw_data = financial_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
-
-        except Exception as e:
-            finding.fail(str(e))
+        financial_data = {
+            "company": target,
+            "filings_analyzed": len(filings),
+            "going_concern_warnings": going_concern_count,
+            "restatements": restatement_count,
+            "non_clean_audit_opinions": qualified_count,
+            "financial_trend": trend_rows[:8] if trend_rows else "No financial trend data available",
+            "auditor_history": auditor_rows if auditor_rows else "No auditor history available",
+            "recent_filings": [
+                {
+                    "date": f.get("filing_date"),
+                    "type": f.get("filing_type"),
+                    "revenue": f.get("revenue"),
+                    "net_income": f.get("net_income"),
+                    "total_debt": f.get("total_debt"),
+                    "auditor": f.get("auditor"),
+                    "opinion": f.get("auditor_opinion"),
+                    "going_concern": f.get("going_concern"),
+                    "restatement": f.get("restatement"),
+                }
+                for f in filings[:5]
+            ],
+        }
 
-        return finding
+        return financial_data
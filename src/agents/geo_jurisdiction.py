@@ -3,8 +3,7 @@ Agent 6: Geo & Jurisdiction Agent
 Maps corporate structure geographically, flags high-risk jurisdictions,
 detects data sovereignty risks, and identifies offshore exposure.
 """
-import json
-from src.agents.base import BaseAgent, AgentFinding
+from src.agents.base import BaseAgent, Request
 from src.elasticsearch.queries import esql_geo_risk
 from config import get_settings
 
@@ -31,6 +30,10 @@ SANCTIONED_COUNTRIES = {
     "Myanmar", "Venezuela", "Zimbabwe",
 }
 
+# Membership sets, built once for C-level set intersection
+_HIGH_RISK_SET = frozenset(HIGH_RISK_JURISDICTIONS)
+_SANCTIONED_SET = frozenset(SANCTIONED_COUNTRIES)
+
 SYSTEM_PROMPT = """You are MERIDIAN's Geo & Jurisdiction Agent. You analyze geographic and
 jurisdictional risk in a company's corporate structure and operations.
 
@@ -52,99 +55,83 @@ Respond with a JSON object:
 
 
 class GeoJurisdictionAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze geo/jurisdictional risk for"
+
     def __init__(self):
         super().__init__("Geo & Jurisdiction")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            entity_id = context.get("entity_id", "")
-
-            # Step 1: ES|QL geo breakdown of all related entities
-            geo_rows = await self._run_esql(esql_geo_risk(entity_id))
+    def plan(self, target: str, context: dict) -> list[Request]:
+        entity_id = context.get("entity_id", "")
 
-            # Step 2: Get all entities for geo_point aggregation
-            entities = await self._search(
+        # Step 1: ES|QL geo breakdown of all related entities
+        requests: list[Request] = [esql_geo_risk(entity_id)]
+        if context.get("primary_entity") is None:
+            # Step 2: direct entity lookup, the fallback used when ES|QL returns nothing.
+            # Skipped when Entity Discovery already shared the subsidiary jurisdictions.
+            requests.append((
                 settings.index_entities,
                 {
                     "query": {
                         "bool": {
                             "should": [
                                 {"match": {"name": target}},
-                                {"term": {"parent_entity_id": entity_id}},
+                                {"term": {"parent_entity_id": entity_id}} if entity_id else {"match_all": {}},
                             ]
                         }
                     },
-                    "aggs": {
-                        "by_jurisdiction": {
-                            "terms": {"field": "jurisdiction", "size": 30}
-                        },
-                        "geo_centroid": {
-                            "geo_centroid": {"field": "geo_location"}
-                        },
-                    },
-                    "size": 0,
+                    "_source": ["jurisdiction", "country_code"],
+                    "size": 50,
                 },
-            )
-
-            # Step 2b: Fallback — search entities directly if ES|QL returned nothing
-            if not geo_rows:
-                direct_entities = await self._search(
-                    settings.index_entities,
-                    {
-                        "query": {
-                            "bool": {
-                                "should": [
-                                    {"match": {"name": target}},
-                                    {"term": {"parent_entity_id": entity_id}} if entity_id else {"match_all": {}},
-                                ]
-                            }
-                        },
-                        "size": 50,
-                    },
-                )
-                for ent in direct_entities:
-                    jur = ent.get("jurisdiction", "")
-                    cc = ent.get("country_code", "")
-                    if jur or cc:
-                        geo_rows.append({"jurisdiction": jur, "country_code": cc, "entity_count": 1})
-
-            # Step 3: Cross-reference with risk lists
-            all_jurisdictions = [row.get("jurisdiction", "") for row in geo_rows]
-            high_risk_found = {
-                j: HIGH_RISK_JURISDICTIONS[j]
-                for j in all_jurisdictions
-                if j in HIGH_RISK_JURISDICTIONS
-            }
-            sanctioned_found = [j for j in all_jurisdictions if j in SANCTIONED_COUNTRIES]
-
-            geo_data = {
-                "company": target,
-                "jurisdiction_breakdown": geo_rows,
-                "total_jurisdictions": len(set(all_jurisdictions)),
-                "high_risk_jurisdictions_found": high_risk_found,
-                "sanctioned_country_exposure": sanctioned_found,
-                "offshore_entity_count": sum(
-                    row.get("entity_count", 0)
-                    for row in geo_rows
-                    if row.get("jurisdiction") in HIGH_RISK_JURISDICTIONS
-                ),
-            }
-
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze geo/jurisdictional risk for '{target}':\n\n{json.dumps(geo_data, indent=2)}",
-            )
-
-            result = json.loads(response)
-            finding.raw_data = geo_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
-
-        except Exception as e:
-            finding.fail(str(e))
-
-        return finding
+            ))
+        return requests
+
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        geo_rows = results[0]
+        primary = context.get("primary_entity")
+
+        # Step 2b: Fallback when ES|QL returned nothing
+        if not geo_rows and primary is not None:
+            geo_rows = [
+                {"jurisdiction": jur, "country_code": "", "entity_count": count}
+                for jur, count in context["subsidiary_jurisdictions"].items()
+            ]
+            if primary.get("jurisdiction") or primary.get("country_code"):
+                geo_rows.append({
+                    "jurisdiction": primary.get("jurisdiction", ""),
+                    "country_code": primary.get("country_code", ""),
+                    "entity_count": 1,
+                })
+        elif not geo_rows:
+            for ent in results[1]:
+                jur = ent.get("jurisdiction", "")
+                cc = ent.get("country_code", "")
+                if jur or cc:
+                    geo_rows.append({"jurisdiction": jur, "country_code": cc, "entity_count": 1})
+
+        return self._summarize(target, geo_rows)
+
+    @staticmethod
+    def _summarize(target: str, geo_rows: list[dict]) -> dict:
+        # Step 3: Cross-reference with risk lists
+        all_jurisdictions = {row.get("jurisdiction", "") for row in geo_rows}
+        high_risk_found = {
+            j: HIGH_RISK_JURISDICTIONS[j]
+            for j in sorted(all_jurisdictions & _HIGH_RISK_SET)
+        }
+        sanctioned_found = sorted(all_jurisdictions & _SANCTIONED_SET)
+
+        geo_data = {
+            "company": target,
+            "jurisdiction_breakdown": geo_rows,
+            "total_jurisdictions": len(all_jurisdictions),
+            "high_risk_jurisdictions_found": high_risk_found,
+            "sanctioned_country_exposure": sanctioned_found,
+            "offshore_entity_count": sum(
+                row.get("entity_count", 0)
+                for row in geo_rows
+                if row.get("jurisdiction") in _HIGH_RISK_SET
+            ),
+        }
+
+        return geo_data
@@ -2,8 +2,8 @@
 Agent 3: Legal Intelligence Agent
 Searches court records, regulatory actions, and sanctions lists.
 """
-import json
-from src.agents.base import BaseAgent, AgentFinding
+from src.agents.base import BaseAgent, Request
+from src.agents.context import InvestigationContext
 from src.elasticsearch.queries import esql_legal_exposure
 from config import get_settings
 
@@ -30,17 +30,17 @@ Respond with a JSON object:
 
 
 class LegalIntelligenceAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze legal exposure for"
+
     def __init__(self):
         super().__init__("Legal Intelligence")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            # Step 1: Aggregate legal exposure via ES|QL
-            exposure_rows = await self._run_esql(esql_legal_exposure(target))
-
-            # Step 2: Get individual cases for narrative detail
-            cases = await self._search(
+    def plan(self, target: str, context: dict) -> list[Request]:
+        # Steps 1-2: ES|QL exposure aggregation and the individual cases for narrative detail
+        return [
+            esql_legal_exposure(InvestigationContext.names_for(target, context)),
+            (
                 settings.index_legal,
                 {
                     "query": {
@@ -53,54 +53,47 @@ class LegalIntelligenceAgent(BaseAgent):
                         }
                     },
                     "sort": [{"filed_date": {"order": "desc"}}],
+                    "_source": ["case_name", "case_type", "filed_date", "status", "outcome", "penalty_amount",
+                                "settlement_amount", "allegations", "regulator", "is_sanction", "sanction_list"],
                     "size": 20,
                 },
-            )
-
-            # Step 3: Check sanctions specifically
-            sanctions = [c for c in cases if c.get("is_sanction")]
-            criminal = [c for c in cases if c.get("case_type") == "criminal"]
-            regulatory = [c for c in cases if c.get("case_type") == "regulatory"]
+            ),
+        ]
 
-            legal_data = {
-                "company": target,
-                "total_cases": len(cases),
-                "sanctions": len(sanctions),
-                "criminal_cases": len(criminal),
-                "regulatory_actions": len(regulatory),
-                "aggregated_exposure": exposure_rows,
-                "notable_cases": [
-                    {
-                        "name": c.get("case_name"),
-                        "type": c.get("case_type"),
-                        "filed": c.get("filed_date"),
-                        "status": c.get("status"),
-                        "outcome": c.get("outcome"),
-                        "penalty": c.get("penalty_amount"),
-                        "settlement": c.get("settlement_amount"),
-                        "allegations": c.get("allegations", []),
-                        "regulator": c.get("regulator"),
-                        "is_sanction": c.get("is_sanction"),
-                        "sanction_list": c.get("sanction_list"),
-                    }
-                    for c in cases[:10]
-                ],
-            }
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        exposure_rows, cases = results
 
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze legal exposure for '{target}':\n\n{json.dumps(legal_data, indent=2)}",
-            )
+        # Step 3: Check sanctions specifically
+        sanction_count = criminal_count = regulatory_count = 0
+        for c in cases:
+            sanction_count += bool(c.get("is_sanction"))
+            case_type = c.get("case_type")
+            criminal_count += case_type == "criminal"
+            regulatory_count += case_type == "regulatory"
 
-            result = json.loads(response)
-            finding.raw_data = legal_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
-
-        except Exception as e:
-            finding.fail(str(e))
+        legal_data = {
+            "company": target,
+            "total_cases": len(cases),
+            "sanctions": sanction_count,
+            "criminal_cases": criminal_count,
+            "regulatory_actions": regulatory_count,
+            "aggregated_exposure": exposure_rows,
+            "notable_cases": [
+                {
+                    "name": c.get("case_name"),
+                    "type": c.get("case_type"),
+                    "filed": c.get("filed_date"),
+                    "status": c.get("status"),
+                    "outcome": c.get("outcome"),
+                    "penalty": c.get("penalty_amount"),
+                    "settlement": c.get("settlement_amount"),
+                    "allegations": c.get("allegations", []),
+                    "regulator": c.get("regulator"),
+                    "is_sanction": c.get("is_sanction"),
+                    "sanction_list": c.get("sanction_list"),
+                }
+                for c in cases[:10]
+            ],
+        }
 
-        return finding
+        return legal_data
@@ -5,11 +5,12 @@ then feeds findings to the Risk Synthesis Agent.
 Streams real-time progress updates via async generator.
 """
 import asyncio
+import bisect
 import json
 from datetime import datetime, timezone
 from typing import AsyncGenerator
 
-from src.agents.base import AgentFinding
+from src.agents.base import AgentFinding, BaseAgent
 from src.agents.entity_discovery import EntityDiscoveryAgent
 from src.agents.financial_signal import FinancialSignalAgent
 from src.agents.legal_intelligence import LegalIntelligenceAgent
@@ -17,61 +18,181 @@ from src.agents.executive_background import ExecutiveBackgroundAgent
 from src.agents.sentiment import SentimentAgent
 from src.agents.geo_jurisdiction import GeoJurisdictionAgent
 from src.agents.risk_synthesis import RiskSynthesisAgent
+from src.agents.composite import CompositeAgent
+from src.agents.context import InvestigationContext
 from src.elasticsearch.client import get_es_client
 from config import get_settings
 
 settings = get_settings()
 
 
+# Stateless agents, built once per process and shared by every investigation
+ENTITY_AGENT = EntityDiscoveryAgent()
+SPECIALISTS: tuple[BaseAgent, ...] = (
+    FinancialSignalAgent(),
+    LegalIntelligenceAgent(),
+    ExecutiveBackgroundAgent(),
+    SentimentAgent(),
+    GeoJurisdictionAgent(),
+)
+FUSED_SPECIALISTS = CompositeAgent(list(SPECIALISTS))
+SYNTHESIS_AGENT = RiskSynthesisAgent()
+
+# Strong refs to in-flight background writes; the event loop only keeps weak ones,
+# and a client disconnect can drop investigate() before it awaits its own task
+_background_writes: set[asyncio.Task] = set()
+
+_THINKING_MESSAGES = {
+    "Financial Signal": "Querying ES|QL for financial trends, auditor changes, SEC filings...",
+    "Legal Intelligence": "Running ES|QL legal exposure aggregation, searching court records...",
+    "Executive Background": "Searching nested employment history, PEP screening...",
+    "Sentiment & Narrative": "Running ES|QL sentiment trends, analyzing news volume spikes...",
+    "Geo & Jurisdiction": "Running ES|QL geo risk breakdown, checking sanctioned jurisdictions...",
+}
+
+
+_RISK_BOUNDS = (2.5, 5.0, 7.5)
+_RISK_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+
 def _risk_level(score: float) -> str:
-    if score < 2.5:
-        return "LOW"
-    elif score < 5.0:
-        return "MEDIUM"
-    elif score < 7.5:
-        return "HIGH"
-    return "CRITICAL"
+    # A score on a bound belongs to the level above it
+    return _RISK_LABELS[bisect.bisect_right(_RISK_BOUNDS, score)]
+
+
+async def _run_specialists(target: str, context: dict) -> AsyncGenerator[AgentFinding, None]:
+    """Yield each specialist agent's finding as soon as it is ready."""
+    if settings.gemini_fused_reasoning:
+        # One Gemini call reasons over all five agents' evidence
+        for finding in await FUSED_SPECIALISTS.run_all(target, context):
+            yield finding
+    else:
+        for next_done in asyncio.as_completed([agent.run(target, context) for agent in SPECIALISTS]):
+            yield await next_done
+
+
+def _actions_list(actions) -> list[str]:
+    """Stored recommended_actions; reports written before it was indexed as a list hold a JSON string."""
+    if isinstance(actions, str):
+        return json.loads(actions or "[]")
+    return actions or []
+
+
+def report_event(inv: dict) -> dict:
+    """The investigation_complete event for a stored, finished investigation document."""
+    return {
+        "event": "investigation_complete",
+        "investigation_id": inv.get("investigation_id"),
+        "target": inv.get("target_name"),
+        "overall_risk_score": inv.get("overall_risk_score"),
+        "risk_level": inv.get("risk_level"),
+        "executive_summary": inv.get("summary", ""),
+        "top_red_flags": inv.get("red_flags", []),
+        "recommended_actions": _actions_list(inv.get("recommended_actions")),
+        "proceed_recommendation": inv.get("proceed_recommendation", "INVESTIGATE_FURTHER"),
+        "agent_findings": [f for f in inv.get("agent_findings", []) if f.get("agent_name") != "Risk Synthesis"],
+        "timestamp": inv.get("completed_at"),
+    }
+
+
+async def _recent_report(es, target: str) -> dict | None:
+    """The latest fully successful investigation of `target` within the cache TTL, or None."""
+    if not settings.investigation_cache_ttl_hours:
+        return None
+    try:
+        result = await es.search(
+            index=settings.index_investigations,
+            body={
+                "query": {
+                    "bool": {
+                        "filter": [
+                            {"term": {"target_name": {"value": target.strip(), "case_insensitive": True}}},
+                            {"term": {"status": "complete"}},
+                            {"range": {"completed_at": {"gte": f"now-{settings.investigation_cache_ttl_hours}h"}}},
+                        ]
+                    }
+                },
+                "sort": [{"completed_at": {"order": "desc"}}],
+                "size": 1,
+            },
+        )
+    except Exception as e:
+        print(f"  [Orchestrator] Investigation cache lookup error (non-fatal): {e}")
+        return None
+    hits = result["hits"]["hits"]
+    return hits[0]["_source"] if hits else None
 
 
 async def investigate(
     target: str,
     investigation_id: str,
+    track_progress: bool = True,
+    force_refresh: bool = False,
 ) -> AsyncGenerator[dict, None]:
     """
     Main orchestration function.
     Yields status events as the investigation progresses.
     Each event is a dict that can be serialized to JSON for SSE/WebSocket streaming.
+    `track_progress=False` skips the "running" placeholder record, for callers that
+    only need the final report (it is overwritten by the final document anyway).
+    A recent finished investigation of the same target is replayed instead of
+    re-running the agents, unless `force_refresh` is set.
     """
     es = get_es_client()
+    started_at = datetime.now(timezone.utc).isoformat()
 
-    # --- Phase 0: Initialize investigation record ---
-    await es.index(
-        index=settings.index_investigations,
-        id=investigation_id,
-        document={
-            "investigation_id": investigation_id,
-            "target_name": target,
-            "status": "running",
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "agent_findings": [],
-        },
-    )
+    cached = None if force_refresh else await _recent_report(es, target)
+    if cached is not None:
+        yield {
+            "event": "investigation_started",
+            "investigation_id": cached["investigation_id"],
+            "target": target,
+            "timestamp": started_at,
+        }
+        for f in cached.get("agent_findings", []):
+            yield {"event": "agent_started", "agent": f["agent_name"]}
+            yield {
+                "event": "agent_complete",
+                "agent": f["agent_name"],
+                "risk_score": f.get("risk_contribution"),
+                "red_flags": f.get("red_flags", []),
+                "findings": f.get("findings"),
+            }
+        yield {**report_event(cached), "cached": True}
+        return
+
+    # --- Phase 0: Initialize investigation record (written in the background) ---
+    init_write = None
+    if track_progress:
+        init_write = asyncio.create_task(es.index(
+            index=settings.index_investigations,
+            id=investigation_id,
+            document={
+                "investigation_id": investigation_id,
+                "target_name": target,
+                "status": "running",
+                "started_at": started_at,
+                "agent_findings": [],
+            },
+        ))
+        _background_writes.add(init_write)
+        init_write.add_done_callback(_background_writes.discard)
 
     yield {
         "event": "investigation_started",
         "investigation_id": investigation_id,
         "target": target,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": started_at,
     }
 
     # --- Phase 1: Entity Discovery (must run first to get entity_id for other agents) ---
     yield {"event": "agent_started", "agent": "Entity Discovery"}
     yield {"event": "agent_thinking", "agent": "Entity Discovery", "thought": "Searching Elasticsearch for entity records..."}
-
-    entity_agent = EntityDiscoveryAgent()
     yield {"event": "agent_thinking", "agent": "Entity Discovery", "thought": "Running hybrid BM25 + fuzzy search on entity index..."}
-    entity_finding = await entity_agent.run(target, {})
-    entity_id = entity_finding.raw_data.get("primary_entity", {}).get("entity_id", "")
+    # Entity Discovery records the resolved entity here for the specialist agents
+    shared_context = InvestigationContext()
+    entity_finding = await ENTITY_AGENT.run(target, shared_context)
+    entity_id = shared_context["entity_id"]
     yield {"event": "agent_thinking", "agent": "Entity Discovery", "thought": "Found entity. Mapping corporate structure and subsidiaries..."}
 
     yield {
@@ -82,38 +203,17 @@ async def investigate(
         "findings": entity_finding.findings,
     }
 
-    shared_context = {"entity_id": entity_id}
-
-    # --- Phase 2: Run 5 specialist agents in staggered batches ---
-    #     (Gemini free tier = 5 req/min, so stagger to avoid rate limits)
-    batch_1 = [
-        FinancialSignalAgent(),
-        LegalIntelligenceAgent(),
-        ExecutiveBackgroundAgent(),
-    ]
-    batch_2 = [
-        SentimentAgent(),
-        GeoJurisdictionAgent(),
-    ]
+    # --- Phase 2: Run 5 specialist agents concurrently ---
+    #     (Gemini quota is enforced by the shared limiters in src.agents.base)
 
     # Emit agent_started with thinking for all
-    thinking_messages = {
-        "Financial Signal": "Querying ES|QL for financial trends, auditor changes, SEC filings...",
-        "Legal Intelligence": "Running ES|QL legal exposure aggregation, searching court records...",
-        "Executive Background": "Searching nested employment history, PEP screening...",
-        "Sentiment & Narrative": "Running ES|QL sentiment trends, analyzing news volume spikes...",
-        "Geo & Jurisdiction": "Running ES|QL geo risk breakdown, checking sanctioned jurisdictions...",
-    }
-
-    for agent in batch_1 + batch_2:
+    for agent in SPECIALISTS:
         yield {"event": "agent_started", "agent": agent.name}
-        yield {"event": "agent_thinking", "agent": agent.name, "thought": thinking_messages.get(agent.name, "Analyzing...")}
+        yield {"event": "agent_thinking", "agent": agent.name, "thought": _THINKING_MESSAGES.get(agent.name, "Analyzing...")}
 
-    # Batch 1: run 3 agents
-    tasks_1 = [agent.run(target, shared_context) for agent in batch_1]
-    findings_1: list[AgentFinding] = await asyncio.gather(*tasks_1)
-
-    for finding in findings_1:
+    specialist_findings: list[AgentFinding] = []
+    async for finding in _run_specialists(target, shared_context):
+        specialist_findings.append(finding)
         yield {"event": "agent_thinking", "agent": finding.agent_name, "thought": "Gemini reasoning complete. Generating findings..."}
         yield {
             "event": "agent_complete",
@@ -122,39 +222,36 @@ async def investigate(
             "red_flags": finding.red_flags,
             "findings": finding.findings,
         }
-
-    # Brief pause between batches to respect rate limits
-    await asyncio.sleep(2)
-
-    # Batch 2: run remaining 2 agents
-    tasks_2 = [agent.run(target, shared_context) for agent in batch_2]
-    findings_2: list[AgentFinding] = await asyncio.gather(*tasks_2)
-
-    for finding in findings_2:
-        yield {"event": "agent_thinking", "agent": finding.agent_name, "thought": "Gemini reasoning complete. Generating findings..."}
-        yield {
-            "event": "agent_complete",
-            "agent": finding.agent_name,
-            "risk_score": finding.risk_contribution,
-            "red_flags": finding.red_flags,
-            "findings": finding.findings,
-        }
-
-    specialist_findings = list(findings_1) + list(findings_2)
+    # Back to a fixed agent order, so the synthesis prompt (and its cache key) is stable
+    order = [agent.name for agent in SPECIALISTS]
+    specialist_findings.sort(key=lambda f: order.index(f.agent_name))
 
     # --- Phase 3: Risk Synthesis (final agent) ---
     yield {"event": "agent_started", "agent": "Risk Synthesis"}
     yield {"event": "agent_thinking", "agent": "Risk Synthesis", "thought": "Collecting all agent findings, computing weighted risk score..."}
 
     all_findings = [entity_finding] + list(specialist_findings)
+    # Serialized once; reused by synthesis, the stored report and the final event
+    all_findings_dicts = [f.to_dict() for f in all_findings]
     synthesis_context = {
-        "agent_findings": [f.to_dict() for f in all_findings],
+        "agent_findings": all_findings_dicts,
     }
 
-    synthesis_agent = RiskSynthesisAgent()
-    synthesis_finding = await synthesis_agent.run(target, synthesis_context)
+    # Relay the synthesis response as it streams, instead of stalling until it is complete.
+    # synthesis_reset means a Gemini retry restarts the response: clear the tokens shown so far.
+    stream: asyncio.Queue[dict | None] = asyncio.Queue()
+    synthesis = asyncio.create_task(SYNTHESIS_AGENT.run(
+        target,
+        synthesis_context,
+        on_token=lambda text: stream.put_nowait({"event": "synthesis_token", "agent": "Risk Synthesis", "text": text}),
+        on_reset=lambda: stream.put_nowait({"event": "synthesis_reset", "agent": "Risk Synthesis"}),
+    ))
+    synthesis.add_done_callback(lambda _: stream.put_nowait(None))
+    while (event := await stream.get()) is not None:
+        yield event
+    synthesis_finding = await synthesis
 
-    full_result = getattr(synthesis_finding, "full_result", {})
+    full_result = synthesis_finding.full_result
 
     yield {
         "event": "agent_complete",
@@ -165,21 +262,37 @@ async def investigate(
     }
 
     # --- Phase 4: Save final report to Elasticsearch ---
+    completed_at = datetime.now(timezone.utc).isoformat()
+    risk_level = _risk_level(synthesis_finding.risk_contribution)
+    # Only fully successful runs are "complete" and eligible for reuse by _recent_report
+    if synthesis_finding.status == "error":
+        status = "failed"
+    elif any(f.status == "error" for f in all_findings):
+        status = "partial"
+    else:
+        status = "complete"
     final_doc = {
         "investigation_id": investigation_id,
         "target_name": target,
         "target_entity_id": entity_id,
-        "status": "complete",
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": datetime.now(timezone.utc).isoformat(),
+        "status": status,
+        "started_at": started_at,
+        "completed_at": completed_at,
         "overall_risk_score": synthesis_finding.risk_contribution,
-        "risk_level": _risk_level(synthesis_finding.risk_contribution),
-        "agent_findings": [f.to_dict() for f in all_findings + [synthesis_finding]],
+        "risk_level": risk_level,
+        "agent_findings": all_findings_dicts + [synthesis_finding.to_dict()],
         "summary": synthesis_finding.findings,
         "red_flags": synthesis_finding.red_flags,
-        "recommended_actions": json.dumps(full_result.get("recommended_actions", [])),
+        "recommended_actions": full_result.get("recommended_actions", []),
+        "proceed_recommendation": full_result.get("proceed_recommendation", "INVESTIGATE_FURTHER"),
     }
 
+    if init_write is not None:
+        # The placeholder must land before the final document, never after it
+        try:
+            await init_write
+        except Exception as e:
+            print(f"  [Orchestrator] Investigation placeholder write failed (non-fatal): {e}")
     await es.index(
         index=settings.index_investigations,
         id=investigation_id,
@@ -192,11 +305,11 @@ async def investigate(
         "investigation_id": investigation_id,
         "target": target,
         "overall_risk_score": synthesis_finding.risk_contribution,
-        "risk_level": _risk_level(synthesis_finding.risk_contribution),
+        "risk_level": risk_level,
         "executive_summary": synthesis_finding.findings,
         "top_red_flags": synthesis_finding.red_flags,
         "recommended_actions": full_result.get("recommended_actions", []),
         "proceed_recommendation": full_result.get("proceed_recommendation", "INVESTIGATE_FURTHER"),
-        "agent_findings": [f.to_dict() for f in all_findings],
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "agent_findings": all_findings_dicts,
+        "timestamp": completed_at,
     }
@@ -3,7 +3,8 @@ Agent 7: Risk Synthesis Agent (Master Reasoning Agent)
 Collects all findings from the 6 specialist agents and synthesizes them
 into a final risk score, executive summary, and recommended actions.
 """
-import json
+import orjson
+from pydantic import BaseModel
 from src.agents.base import BaseAgent, AgentFinding
 from config import get_settings
 
@@ -38,6 +39,16 @@ Respond with a JSON object:
 }
 """
 
+
+class SynthesisResult(BaseModel):
+    """Fields of the synthesis response the report depends on; the rest pass through as-is."""
+    overall_risk_score: float
+    executive_summary: str
+    top_red_flags: list[str]
+    recommended_actions: list[str] = []
+    proceed_recommendation: str = "INVESTIGATE_FURTHER"
+
+
 # Weights for each agent's risk score in the final calculation
 AGENT_WEIGHTS = {
     "Legal Intelligence": 0.30,
@@ -53,14 +64,19 @@ class RiskSynthesisAgent(BaseAgent):
     def __init__(self):
         super().__init__("Risk Synthesis")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
+    async def run(self, target: str, context: dict, on_token=None, on_reset=None) -> AgentFinding:
+        """
+        `on_token`, if given, receives the synthesis response text as Gemini streams it;
+        `on_reset` is called when a retry discards the text streamed so far.
+        """
         finding = AgentFinding(self.name)
         try:
             agent_findings = context.get("agent_findings", [])
 
             # Step 1: Build weighted risk score
             weighted_score = 0.0
-            all_red_flags = []
+            total_red_flags = 0
+            unique_red_flags = {}  # insertion-ordered set, so the prompt is deterministic
             findings_summary = {}
 
             for af in agent_findings:
@@ -68,42 +84,35 @@ class RiskSynthesisAgent(BaseAgent):
                 weight = AGENT_WEIGHTS.get(agent_name, 0.05)
                 risk = af.get("risk_contribution", 0.0)
                 weighted_score += risk * weight
-                all_red_flags.extend(af.get("red_flags", []))
+                red_flags = af.get("red_flags", [])
+                total_red_flags += len(red_flags)
+                unique_red_flags.update(dict.fromkeys(red_flags))
                 findings_summary[agent_name] = {
                     "risk_score": risk,
                     "weight": weight,
                     "weighted_contribution": risk * weight,
                     "key_findings": af.get("findings", "")[:500],
-                    "red_flags": af.get("red_flags", []),
+                    "red_flags": red_flags,
                 }
 
             synthesis_input = {
                 "company": target,
                 "preliminary_weighted_score": round(weighted_score, 2),
-                "total_red_flags": len(all_red_flags),
-                "unique_red_flags": list(set(all_red_flags)),
+                "total_red_flags": total_red_flags,
+                "unique_red_flags": list(unique_red_flags),
                 "agent_findings_summary": findings_summary,
             }
 
             # Step 2: Claude synthesizes all findings
             response = await self._ask_llm(
                 SYSTEM_PROMPT,
-                f"Synthesize all investigation findings for '{target}':\n\n{json.dumps(synthesis_input, indent=2)}",
+                f"Synthesize all investigation findings for '{target}':\n\n{orjson.dumps(synthesis_input).decode()}",
+                validate=SynthesisResult.model_validate_json,
+                on_token=on_token,
+                on_reset=on_reset,
             )
 
-            result = json.loads(response)
-
-            # Step 3: Store the final investigation in Elasticsearch
-            investigation_doc = {
-                "target_name": target,
-                "overall_risk_score": result["overall_risk_score"],
-                "risk_level": result["risk_level"],
-                "summary": result["executive_summary"],
-                "red_flags": result["top_red_flags"],
-                "recommended_actions": "\n".join(result["recommended_actions"]),
-                "agent_findings": [af for af in agent_findings],
-                "status": "complete",
-            }
+            result = orjson.loads(response)
 
             finding.raw_data = {
                 "synthesis": result,
@@ -3,8 +3,8 @@ Agent 5: Sentiment & Narrative Agent
 Time-series sentiment analysis across news sources.
 Detects narrative shifts, coordinated PR campaigns, and emerging controversies.
 """
-import json
-from src.agents.base import BaseAgent, AgentFinding
+from src.agents.base import BaseAgent, Request
+from src.agents.context import InvestigationContext
 from src.elasticsearch.queries import (
     esql_sentiment_trend,
     esql_news_volume_spike,
@@ -34,21 +34,23 @@ Respond with a JSON object:
 
 
 class SentimentAgent(BaseAgent):
+    system_prompt = SYSTEM_PROMPT
+    task = "Analyze sentiment and narrative for"
+
     def __init__(self):
         super().__init__("Sentiment & Narrative")
 
-    async def run(self, target: str, context: dict) -> AgentFinding:
-        finding = AgentFinding(self.name)
-        try:
-            # Step 1: Sentiment trend over time (ES|QL time-series)
-            trend_1yr = await self._run_esql(esql_sentiment_trend(target, days=365))
-            trend_5yr = await self._run_esql(esql_sentiment_trend(target, days=1825))
-
-            # Step 2: Detect recent volume spikes
-            spike_data = await self._run_esql(esql_news_volume_spike(target, days=30))
-
-            # Step 3: Get recent negative articles for narrative context
-            negative_news = await self._search(
+    def plan(self, target: str, context: dict) -> list[Request]:
+        # Step 1: Sentiment trend over time (ES|QL time-series)
+        # Step 2: Detect recent volume spikes
+        # Steps 3-4: Recent negative articles for narrative context, and positive ones for balance
+        # The ES|QL queries run concurrently; both searches share one _msearch
+        names = InvestigationContext.names_for(target, context)
+        return [
+            esql_sentiment_trend(names, days=365),
+            esql_sentiment_trend(names, days=1825),
+            esql_news_volume_spike(names, days=30),
+            (
                 settings.index_news,
                 {
                     "query": {
@@ -60,12 +62,11 @@ class SentimentAgent(BaseAgent):
                         }
                     },
                     "sort": [{"published_at": {"order": "desc"}}],
+                    "_source": ["title", "source_name", "published_at", "sentiment_score", "topics"],
                     "size": 10,
                 },
-            )
-
-            # Step 4: Get recent positive articles too for balance
-            positive_news = await self._search(
+            ),
+            (
                 settings.index_news,
                 {
                     "query": {
@@ -77,51 +78,40 @@ class SentimentAgent(BaseAgent):
                         }
                     },
                     "sort": [{"published_at": {"order": "desc"}}],
+                    "_source": ["title", "source_name", "published_at"],
                     "size": 5,
                 },
-            )
+            ),
+        ]
 
-            sentiment_data = {
-                "company": target,
-                "sentiment_trend_1yr": trend_1yr if trend_1yr else "No trend data available",
-                "sentiment_trend_5yr": trend_5yr[:12] if trend_5yr else "No long-term trend data",
-                "volume_spike_analysis": spike_data if spike_data else "No spike data available",
-                "total_negative_articles": len(negative_news),
-                "total_positive_articles": len(positive_news),
-                "recent_negative_articles": [
-                    {
-                        "title": a.get("title"),
-                        "source": a.get("source_name"),
-                        "date": a.get("published_at"),
-                        "sentiment": a.get("sentiment_score"),
-                        "topics": a.get("topics", []),
-                    }
-                    for a in negative_news
-                ],
-                "recent_positive_articles": [
-                    {
-                        "title": a.get("title"),
-                        "source": a.get("source_name"),
-                        "date": a.get("published_at"),
-                    }
-                    for a in positive_news
-                ],
-            }
+    def analyze(self, target: str, context: dict, results: list[list[dict]]) -> dict | None:
+        trend_1yr, trend_5yr, spike_data, negative_news, positive_news = results
 
-            response = await self._ask_llm(
-                SYSTEM_PROMPT,
-                f"Analyze sentiment and narrative for '{target}':\n\n{json.dumps(sentiment_data, indent=2)}",
-            )
-
-            result = json.loads(response)
-            finding.raw_data = sentiment_data
-            finding.complete(
-                findings=result["findings"],
-                risk_score=result["risk_score"],
-                red_flags=result["red_flags"],
-            )
-
-        except Exception as e:
-            finding.fail(str(e))
+        sentiment_data = {
+            "company": target,
+            "sentiment_trend_1yr": trend_1yr if trend_1yr else "No trend data available",
+            "sentiment_trend_5yr": trend_5yr[:12] if trend_5yr else "No long-term trend data",
+            "volume_spike_analysis": spike_data if spike_data else "No spike data available",
+            "total_negative_articles": len(negative_news),
+            "total_positive_articles": len(positive_news),
+            "recent_negative_articles": [
+                {
+                    "title": a.get("title"),
+                    "source": a.get("source_name"),
+                    "date": a.get("published_at"),
+                    "sentiment": a.get("sentiment_score"),
+                    "topics": a.get("topics", []),
+                }
+                for a in negative_news
+            ],
+            "recent_positive_articles": [
+                {
+                    "title": a.get("title"),
+                    "source": a.get("source_name"),
+                    "date": a.get("published_at"),
+                }
+                for a in positive_news
+            ],
+        }
 
-        return finding
+        return sentiment_data
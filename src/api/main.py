@@ -3,18 +3,17 @@ Meridian FastAPI application.
 Provides REST + Server-Sent Events (SSE) endpoints for real-time investigation streaming.
 """
 import uuid
-import json
-import asyncio
+import orjson
 import os
 from datetime import datetime, timezone
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-from src.agents.orchestrator import investigate
+from src.agents.orchestrator import investigate, report_event
 from src.elasticsearch.client import get_es_client, close_es_client
 from src.elasticsearch.indices import create_all_indices
 from src.elasticsearch.vector_search import semantic_search_news, get_embedding
@@ -26,6 +25,7 @@ app = FastAPI(
     title="MERIDIAN",
     description="Multi-Agent Corporate Intelligence & Due Diligence Platform",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -57,6 +57,23 @@ async def shutdown():
 class InvestigateRequest(BaseModel):
     target: str
     investigation_id: str | None = None
+    force_refresh: bool = False  # skip reuse of a recent report for the same target
+
+
+# ---------- SSE ----------
+
+def _sse_frame(event_id: int, event: dict) -> str:
+    """One SSE frame. `event:` lets EventSource clients bind per-type listeners; `id:` enables resume."""
+    return f"id: {event_id}\nevent: {event.get('event', 'message')}\ndata: {orjson.dumps(event).decode()}\n\n"
+
+
+async def _completed_event(investigation_id: str) -> dict | None:
+    """The investigation_complete event rebuilt from a stored finished investigation, or None."""
+    es = get_es_client()
+    doc = await es.options(ignore_status=404).get(index=settings.index_investigations, id=investigation_id)
+    if not doc.get("found") or doc["_source"].get("status") == "running":
+        return None
+    return report_event(doc["_source"])
 
 
 # ---------- Routes ----------
@@ -67,25 +84,37 @@ async def health():
 
 
 @app.post("/investigate/stream")
-async def investigate_stream(req: InvestigateRequest):
+async def investigate_stream(req: InvestigateRequest, last_event_id: str | None = Header(default=None)):
     """
     Start an investigation and stream real-time events via Server-Sent Events.
-    Each event is a JSON object pushed as `data: {...}\\n\\n`.
+    Each event is a frame of `id:`, `event:` (the event type) and `data: {...}` (JSON).
+    A reconnect carrying `Last-Event-ID` for an investigation that has since finished
+    gets the stored final report instead of a re-run of every agent.
     """
     investigation_id = req.investigation_id or str(uuid.uuid4())
+    replay = None
+    if last_event_id is not None and req.investigation_id:
+        replay = await _completed_event(req.investigation_id)
 
     async def event_generator():
-        async for event in investigate(req.target, investigation_id):
-            yield f"data: {json.dumps(event)}\n\n"
-            await asyncio.sleep(0)  # yield control to allow streaming
-        yield "data: {\"event\": \"stream_end\"}\n\n"
+        event_id = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+        if replay:
+            yield _sse_frame(event_id, replay)
+            event_id += 1
+        else:
+            async for event in investigate(req.target, investigation_id, force_refresh=req.force_refresh):
+                yield _sse_frame(event_id, event)
+                event_id += 1
+        yield _sse_frame(event_id, {"event": "stream_end"})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
+            # Tell proxies not to buffer, and compression middleware not to hold events back
             "X-Accel-Buffering": "no",
+            "Content-Encoding": "identity",
         },
     )
 
@@ -99,14 +128,15 @@ async def investigate_sync(req: InvestigateRequest):
     investigation_id = req.investigation_id or str(uuid.uuid4())
     final_event = None
 
-    async for event in investigate(req.target, investigation_id):
+    async for event in investigate(req.target, investigation_id, track_progress=False,
+                                   force_refresh=req.force_refresh):
         if event.get("event") == "investigation_complete":
             final_event = event
 
     if not final_event:
         raise HTTPException(status_code=500, detail="Investigation failed to complete")
 
-    return JSONResponse(content=final_event)
+    return ORJSONResponse(content=final_event)
 
 
 @app.get("/investigations/{investigation_id}")
@@ -118,7 +148,7 @@ async def get_investigation(investigation_id: str):
             index=settings.index_investigations,
             id=investigation_id,
         )
-        return JSONResponse(content=result["_source"])
+        return ORJSONResponse(content=result["_source"])
     except Exception:
         raise HTTPException(status_code=404, detail="Investigation not found")
 
@@ -136,7 +166,7 @@ async def list_investigations(size: int = 20):
         },
     )
     hits = [h["_source"] for h in result["hits"]["hits"]]
-    return JSONResponse(content={"investigations": hits, "total": result["hits"]["total"]["value"]})
+    return ORJSONResponse(content={"investigations": hits, "total": result["hits"]["total"]["value"]})
 
 
 @app.get("/search/entities")
@@ -158,7 +188,7 @@ async def search_entities(q: str, size: int = 10):
             "size": size,
         },
     )
-    return JSONResponse(content={"entities": [h["_source"] for h in result["hits"]["hits"]]})
+    return ORJSONResponse(content={"entities": [h["_source"] for h in result["hits"]["hits"]]})
 
 
 @app.delete("/investigations/{investigation_id}")
@@ -188,15 +218,18 @@ async def semantic_search(body: dict):
     """
     Semantic vector search across news articles.
     Showcases Elasticsearch kNN + dense_vector capabilities.
-    Body: { "query": "corporate fraud allegations", "size": 5 }
+    Body: { "query": "corporate fraud allegations", "size": 5, "days": 30, "entity_name": "Acme Corp" }
+    (`days` and `entity_name` are optional filters)
     """
     query = body.get("query", "")
     size = body.get("size", 5)
     if not query:
         raise HTTPException(status_code=400, detail="Missing 'query'")
     try:
-        results = await semantic_search_news(query, size)
-        return JSONResponse(content={"results": results, "query": query, "search_type": "knn_vector"})
+        results = await semantic_search_news(
+            query, size, days=body.get("days"), entity_name=body.get("entity_name"),
+        )
+        return ORJSONResponse(content={"results": results, "query": query, "search_type": "knn_vector"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -210,6 +243,6 @@ async def run_esql(body: dict):
     es = get_es_client()
     try:
         result = await es.esql.query(body=body)
-        return JSONResponse(content=result.body)
+        return ORJSONResponse(content=result.body)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,49 @@
+"""
+Buffered bulk writer for Meridian ingesters.
+Collects docs across many producers and ships them in _bulk requests once a
+doc-count or byte threshold is reached, instead of one index call per doc.
+"""
+import orjson
+from elasticsearch.helpers import async_bulk
+
+
+class BulkBuffer:
+    def __init__(self, es, threshold: int = 500, max_bytes: int = 5 * 1024 * 1024):
+        self.es = es
+        self.threshold = threshold
+        self.max_bytes = max_bytes
+        self._actions: list[dict] = []
+        self._bytes = 0
+        self.indexed = 0
+        self.errors: list[dict] = []
+
+    async def add(self, index: str, doc: dict, doc_id: str | None = None, pipeline: str | None = None):
+        """
+        Queue a doc for indexing, optionally through an ingest `pipeline`.
+        Flushes automatically when a threshold is hit.
+        """
+        source = orjson.dumps(doc)
+        action = {"_index": index, "_source": source}
+        if doc_id is not None:
+            action["_id"] = doc_id
+        if pipeline is not None:
+            action["pipeline"] = pipeline
+        self._actions.append(action)
+        self._bytes += len(source)
+        if len(self._actions) >= self.threshold or self._bytes >= self.max_bytes:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Send everything buffered so far. Returns the number of docs indexed."""
+        if not self._actions:
+            return 0
+        # Swap the buffer out first so producers can keep adding while this flush is in flight
+        actions, self._actions, self._bytes = self._actions, [], 0
+        success, errors = await async_bulk(
+            self.es, actions, chunk_size=self.threshold, raise_on_error=False,
+        )
+        self.indexed += success
+        self.errors.extend(errors)
+        for err in errors:
+            print(f"  Bulk index error: {err}")
+        return success
@@ -1,24 +1,59 @@
+import orjson
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.serializer import JSONSerializer
+from elastic_transport import SerializationError
 from functools import lru_cache
 from config import get_settings
 
 _client: AsyncElasticsearch | None = None
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON request/response bodies via orjson; unknown types still go through JSONSerializer.default."""
+
+    def dumps(self, data) -> bytes:
+        if isinstance(data, (str, bytes)):
+            return super().dumps(data)
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_NAIVE_UTC)
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(message=f"Unable to serialize to JSON: {data!r}", errors=(e,))
+
+    def loads(self, data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(message=f"Unable to deserialize as JSON: {data!r}", errors=(e,))
+
+
 def get_es_client() -> AsyncElasticsearch:
     global _client
     if _client is None:
         settings = get_settings()
+        # One process-wide client: every agent shares its keep-alive connection pool.
+        # Gzip request/response bodies, and size the pool for all agents' concurrent queries.
+        common = dict(
+            node_class="aiohttp",
+            serializer=OrjsonSerializer(),
+            http_compress=True,
+            connections_per_node=32,
+            request_timeout=30,
+            retry_on_timeout=True,
+            max_retries=2,
+        )
         if settings.es_api_key:
             _client = AsyncElasticsearch(
                 settings.es_url,
                 api_key=settings.es_api_key,
+                **common,
             )
         else:
             _client = AsyncElasticsearch(
                 settings.es_url,
                 basic_auth=(settings.es_username, settings.es_password),
-                verify_certs=False,
+                # Self-signed local clusters only; verify certs everywhere else
+                verify_certs=settings.app_env != "development",
+                **common,
             )
     return _client
 
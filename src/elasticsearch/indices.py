@@ -1,15 +1,19 @@
 """
 Elasticsearch index mappings for Meridian.
 Each index is designed to maximally use ES capabilities:
-  - dense_vector fields  → vector/semantic search
+  - dense_vector fields  → vector/semantic search (int8 "byte" elements, kept out of _source;
+                           only fields something runs kNN on build an HNSW graph)
   - keyword + text       → hybrid search
   - geo_point            → geo queries
   - date + numeric       → ES|QL time-series analytics
 """
+import asyncio
+from contextlib import asynccontextmanager
 
 INDICES = {
     "meridian-entities": {
         "mappings": {
+            "_source": {"excludes": ["name_vector"]},
             "properties": {
                 "entity_id": {"type": "keyword"},
                 "name": {
@@ -19,8 +23,8 @@ INDICES = {
                 "name_vector": {
                     "type": "dense_vector",
                     "dims": 384,
-                    "index": True,
-                    "similarity": "cosine",
+                    "element_type": "byte",
+                    "index": False,  # not kNN-searched yet: no HNSW graph
                 },
                 "aliases": {"type": "keyword"},
                 "entity_type": {"type": "keyword"},  # company | person | foundation
@@ -49,6 +53,7 @@ INDICES = {
 
     "meridian-filings": {
         "mappings": {
+            "_source": {"excludes": ["content_vector"]},
             "properties": {
                 "filing_id": {"type": "keyword"},
                 "entity_id": {"type": "keyword"},
@@ -62,8 +67,8 @@ INDICES = {
                 "content_vector": {
                     "type": "dense_vector",
                     "dims": 384,
-                    "index": True,
-                    "similarity": "cosine",
+                    "element_type": "byte",
+                    "index": False,  # not kNN-searched yet: no HNSW graph
                 },
                 "revenue": {"type": "float"},
                 "net_income": {"type": "float"},
@@ -83,6 +88,7 @@ INDICES = {
 
     "meridian-legal": {
         "mappings": {
+            "_source": {"excludes": ["summary_vector"]},
             "properties": {
                 "case_id": {"type": "keyword"},
                 "entity_ids": {"type": "keyword"},
@@ -93,8 +99,8 @@ INDICES = {
                 "summary_vector": {
                     "type": "dense_vector",
                     "dims": 384,
-                    "index": True,
-                    "similarity": "cosine",
+                    "element_type": "byte",
+                    "index": False,  # not kNN-searched yet: no HNSW graph
                 },
                 "court": {"type": "keyword"},
                 "jurisdiction": {"type": "keyword"},
@@ -118,6 +124,7 @@ INDICES = {
 
     "meridian-news": {
         "mappings": {
+            "_source": {"excludes": ["content_vector"]},
             "properties": {
                 "article_id": {"type": "keyword"},
                 "entity_ids": {"type": "keyword"},
@@ -127,6 +134,7 @@ INDICES = {
                 "content_vector": {
                     "type": "dense_vector",
                     "dims": 384,
+                    "element_type": "byte",
                     "index": True,
                     "similarity": "cosine",
                 },
@@ -147,6 +155,7 @@ INDICES = {
 
     "meridian-executives": {
         "mappings": {
+            "_source": {"excludes": ["name_vector"]},
             "properties": {
                 "person_id": {"type": "keyword"},
                 "full_name": {
@@ -156,8 +165,8 @@ INDICES = {
                 "name_vector": {
                     "type": "dense_vector",
                     "dims": 384,
-                    "index": True,
-                    "similarity": "cosine",
+                    "element_type": "byte",
+                    "index": False,  # not kNN-searched yet: no HNSW graph
                 },
                 "aliases": {"type": "keyword"},
                 "current_entity_id": {"type": "keyword"},
@@ -213,25 +222,138 @@ INDICES = {
                 "summary": {"type": "text"},
                 "red_flags": {"type": "keyword"},
                 "recommended_actions": {"type": "text"},
+                "proceed_recommendation": {"type": "keyword"},
                 "report_url": {"type": "keyword"},
                 "requested_by": {"type": "keyword"},
             }
         },
         "settings": {"number_of_shards": 1, "number_of_replicas": 0},
     },
+
+    # Agent LLM responses keyed by sha256(model + system prompt + user message); lookup is by _id only
+    "meridian-llm-cache": {
+        "mappings": {
+            "properties": {
+                "agent_name": {"type": "keyword"},
+                "model": {"type": "keyword"},
+                "response": {"type": "text", "index": False},
+                "cached_at": {"type": "date"},
+            }
+        },
+        "settings": {"number_of_shards": 1, "number_of_replicas": 0},
+    },
 }
 
 
+# Ingest pipelines applied server-side at index time (selected per bulk action via "pipeline")
+PIPELINES = {
+    # Synthetic news: derive source_url from the article_id (computed client-side by ingest_all)
+    "meridian-news-enrich": {
+        "description": "Derive source_url for synthetic news articles",
+        "processors": [
+            {
+                "script": {
+                    "lang": "painless",
+                    "source": """
+                        if (ctx.source_url == null && ctx.source_name != null && ctx.article_id != null) {
+                            String id = ctx.article_id;
+                            ctx.source_url = 'https://' + ctx.source_name.toLowerCase().replace(' ', '')
+                                + '.com/article/' + id.substring(0, Math.min(8, id.length()));
+                        }
+                    """,
+                }
+            }
+        ],
+    },
+    # CourtListener dockets: constant fields plus case_type/status/summary derived from
+    # the raw nature_of_suit, which is dropped once used (it isn't mapped)
+    "meridian-court-listener": {
+        "description": "Normalize CourtListener dockets into meridian-legal case records",
+        "processors": [
+            {"set": {"field": "jurisdiction", "value": "US Federal"}},
+            {"set": {"field": "source", "value": "CourtListener"}},
+            {"set": {"field": "is_sanction", "value": False}},
+            {
+                "script": {
+                    "lang": "painless",
+                    "source": """
+                        String nos = ctx.nature_of_suit == null ? '' : ctx.nature_of_suit;
+                        ctx.case_type = 'civil';
+                        for (String word : /[^a-z]+/.split(nos.toLowerCase())) {
+                            if (params.regulatory_terms.contains(word)) {
+                                ctx.case_type = 'regulatory';
+                                break;
+                            }
+                        }
+                        ctx.status = ctx.resolved_date != null ? 'resolved' : 'active';
+                        ctx.case_summary = nos + ' - ' + ctx.case_name;
+                        ctx.allegations = nos.isEmpty() ? [] : [nos];
+                    """,
+                    "params": {"regulatory_terms": ["securities", "fraud", "antitrust"]},
+                }
+            },
+            {"remove": {"field": "nature_of_suit", "ignore_missing": True}},
+        ],
+    },
+}
+
+
+async def _ensure_index(es_client, index_name: str, config: dict):
+    """Create one index unless it already exists."""
+    if await es_client.indices.exists(index=index_name):
+        print(f"  Index already exists: {index_name}")
+        return
+    await es_client.indices.create(
+        index=index_name,
+        mappings=config["mappings"],
+        settings=config["settings"],
+    )
+    print(f"  Created index: {index_name}")
+
+
 async def create_all_indices(es_client):
-    """Create all Meridian indices if they don't exist."""
-    for index_name, config in INDICES.items():
-        exists = await es_client.indices.exists(index=index_name)
-        if not exists:
-            await es_client.indices.create(
-                index=index_name,
-                mappings=config["mappings"],
-                settings=config["settings"],
-            )
-            print(f"  Created index: {index_name}")
-        else:
-            print(f"  Index already exists: {index_name}")
+    """Create all Meridian indices (and ingest pipelines) if they don't exist."""
+    # put_pipeline is idempotent; keep pipeline definitions in sync on every run
+    await asyncio.gather(*[
+        es_client.ingest.put_pipeline(id=pipeline_id, **body) for pipeline_id, body in PIPELINES.items()
+    ])
+
+    # Multi-target exists is true only if every index exists: one round-trip in the common case
+    if await es_client.indices.exists(index=",".join(INDICES)):
+        print(f"  All {len(INDICES)} indices already exist")
+        return
+    # Otherwise check/create each index concurrently; they're independent
+    await asyncio.gather(*[
+        _ensure_index(es_client, index_name, config) for index_name, config in INDICES.items()
+    ])
+
+
+async def set_bulk_ingest_mode(es_client, index_names: list[str], enabled: bool):
+    """
+    Toggle bulk-load index settings: no periodic refresh and async translog
+    while ingesting; back to defaults (null resets a setting) and refresh afterwards.
+    """
+    await es_client.indices.put_settings(
+        index=",".join(index_names),
+        settings={
+            "index": {
+                "refresh_interval": "-1" if enabled else None,
+                "translog": {
+                    "durability": "async" if enabled else None,
+                    "flush_threshold_size": "1gb" if enabled else None,
+                },
+            }
+        },
+    )
+    if not enabled:
+        await es_client.indices.refresh(index=",".join(index_names))
+
+
+@asynccontextmanager
+async def bulk_ingest_mode(es_client, index_names: list[str]):
+    """Hold `index_names` in bulk-load settings for the block, restoring them even if it fails."""
+    await set_bulk_ingest_mode(es_client, index_names, enabled=True)
+    try:
+        yield
+    finally:
+        await set_bulk_ingest_mode(es_client, index_names, enabled=False)
@@ -2,11 +2,41 @@
 Reusable Elasticsearch query builders for Meridian agents.
 Uses ES|QL, hybrid search, vector search, and geo queries.
 """
+from dataclasses import dataclass
 from config import get_settings
 
 settings = get_settings()
 
 
+@dataclass(frozen=True, slots=True)
+class EsqlQuery:
+    """
+    An ES|QL query plus a Query DSL `filter` the engine applies first. Lookups by
+    entity go in the filter: term queries use the keyword index (and match any
+    value of a multi-valued field) where a `LIKE "*name*"` scans every doc, and the
+    caller's value never gets spliced into the query text.
+    """
+    query: str
+    filter: dict | None = None
+
+
+def entity_name_filter(field: str, names: str | list[str]) -> dict:
+    """
+    Match docs whose keyword `field` equals any of `names`, ignoring case. Pass the
+    target together with the resolved entity's name and aliases (see
+    `InvestigationContext.names_for`) so "tesla" still finds "Tesla, Inc.".
+    """
+    if isinstance(names, str):
+        names = [names]
+    unique = list(dict.fromkeys(n for n in names if n))
+    return {
+        "bool": {
+            "should": [{"term": {field: {"value": n, "case_insensitive": True}}} for n in unique],
+            "minimum_should_match": 1,
+        }
+    }
+
+
 def hybrid_entity_search(query: str, size: int = 10) -> dict:
     """Hybrid BM25 + vector search for entity lookup."""
     return {
@@ -24,12 +54,11 @@ def hybrid_entity_search(query: str, size: int = 10) -> dict:
     }
 
 
-def esql_sentiment_trend(entity_name: str, days: int = 365) -> str:
-    """ES|QL: sentiment trend over time for an entity."""
-    return f"""
+# ES|QL texts, rendered against the configured index names once at import.
+# Only `days` is filled in per call; entity values travel in the EsqlQuery filter.
+_SENTIMENT_TREND = f"""
     FROM {settings.index_news}
-    | WHERE entity_names LIKE "*{entity_name}*"
-    | WHERE published_at >= NOW() - {days} days
+    | WHERE published_at >= NOW() - {{days}} days
     | EVAL month = DATE_TRUNC(1 month, published_at)
     | STATS
         avg_sentiment = AVG(sentiment_score),
@@ -40,12 +69,8 @@ def esql_sentiment_trend(entity_name: str, days: int = 365) -> str:
     | SORT month ASC
     """
 
-
-def esql_legal_exposure(entity_name: str) -> str:
-    """ES|QL: aggregate legal exposure for an entity."""
-    return f"""
+_LEGAL_EXPOSURE = f"""
     FROM {settings.index_legal}
-    | WHERE entity_names LIKE "*{entity_name}*"
     | STATS
         total_cases = COUNT(*),
         active_cases = SUM(CASE(status == "active", 1, 0)),
@@ -57,24 +82,16 @@ def esql_legal_exposure(entity_name: str) -> str:
       BY entity_names
     """
 
-
-def esql_financial_trend(entity_name: str) -> str:
-    """ES|QL: revenue and debt trend over time."""
-    return f"""
+_FINANCIAL_TREND = f"""
     FROM {settings.index_filings}
-    | WHERE entity_name LIKE "*{entity_name}*"
     | WHERE filing_type IN ("10-K", "annual")
     | SORT filing_date ASC
     | KEEP filing_date, revenue, net_income, total_assets, total_debt,
            auditor_opinion, going_concern, restatement
     """
 
-
-def esql_executive_risk_pattern(person_id: str) -> str:
-    """ES|QL: count of failed companies an executive has been associated with."""
-    return f"""
+_EXECUTIVE_RISK_PATTERN = f"""
     FROM {settings.index_executives}
-    | WHERE person_id == "{person_id}"
     | MV_EXPAND employment_history
     | STATS
         total_roles = COUNT(*),
@@ -88,23 +105,15 @@ def esql_executive_risk_pattern(person_id: str) -> str:
         )
     """
 
-
-def esql_geo_risk(entity_id: str) -> str:
-    """ES|QL: jurisdictions breakdown for an entity tree."""
-    return f"""
+_GEO_RISK = f"""
     FROM {settings.index_entities}
-    | WHERE entity_id == "{entity_id}" OR parent_entity_id == "{entity_id}"
     | STATS entity_count = COUNT(*) BY country_code, jurisdiction
     | SORT entity_count DESC
     """
 
-
-def esql_news_volume_spike(entity_name: str, days: int = 30) -> str:
-    """ES|QL: detect recent news volume spike vs historical baseline."""
-    return f"""
+_NEWS_VOLUME_SPIKE = f"""
     FROM {settings.index_news}
-    | WHERE entity_names LIKE "*{entity_name}*"
-    | EVAL is_recent = published_at >= NOW() - {days} days
+    | EVAL is_recent = published_at >= NOW() - {{days}} days
     | STATS
         recent_count = SUM(CASE(is_recent == true, 1, 0)),
         historical_count = SUM(CASE(is_recent == false, 1, 0)),
@@ -112,12 +121,50 @@ def esql_news_volume_spike(entity_name: str, days: int = 30) -> str:
         historical_negative = SUM(CASE(is_recent == false AND sentiment_label == "negative", 1, 0))
     """
 
-
-def esql_auditor_changes(entity_name: str) -> str:
-    """ES|QL: detect auditor changes over time (a major red flag)."""
-    return f"""
+_AUDITOR_CHANGES = f"""
     FROM {settings.index_filings}
-    | WHERE entity_name LIKE "*{entity_name}*"
     | SORT filing_date ASC
     | STATS auditor_list = VALUES(auditor) BY filing_type
     """
+
+
+def esql_sentiment_trend(names: str | list[str], days: int = 365) -> EsqlQuery:
+    """ES|QL: sentiment trend over time for an entity."""
+    return EsqlQuery(_SENTIMENT_TREND.format(days=int(days)), filter=entity_name_filter("entity_names", names))
+
+
+def esql_legal_exposure(names: str | list[str]) -> EsqlQuery:
+    """ES|QL: aggregate legal exposure for an entity."""
+    return EsqlQuery(_LEGAL_EXPOSURE, filter=entity_name_filter("entity_names", names))
+
+
+def esql_financial_trend(names: str | list[str]) -> EsqlQuery:
+    """ES|QL: revenue and debt trend over time."""
+    return EsqlQuery(_FINANCIAL_TREND, filter=entity_name_filter("entity_name", names))
+
+
+def esql_executive_risk_pattern(person_id: str) -> EsqlQuery:
+    """ES|QL: count of failed companies an executive has been associated with."""
+    return EsqlQuery(_EXECUTIVE_RISK_PATTERN, filter={"term": {"person_id": person_id}})
+
+
+def esql_geo_risk(entity_id: str) -> EsqlQuery:
+    """ES|QL: jurisdictions breakdown for an entity tree."""
+    return EsqlQuery(_GEO_RISK, filter={
+        "bool": {
+            "should": [
+                {"term": {"entity_id": entity_id}},
+                {"term": {"parent_entity_id": entity_id}},
+            ]
+        }
+    })
+
+
+def esql_news_volume_spike(names: str | list[str], days: int = 30) -> EsqlQuery:
+    """ES|QL: detect recent news volume spike vs historical baseline."""
+    return EsqlQuery(_NEWS_VOLUME_SPIKE.format(days=int(days)), filter=entity_name_filter("entity_names", names))
+
+
+def esql_auditor_changes(names: str | list[str]) -> EsqlQuery:
+    """ES|QL: detect auditor changes over time (a major red flag)."""
+    return EsqlQuery(_AUDITOR_CHANGES, filter=entity_name_filter("entity_name", names))
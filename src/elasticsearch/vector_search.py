@@ -3,54 +3,136 @@ Vector / Semantic search utilities for Meridian.
 Uses Gemini embedding API to generate vectors, then Elasticsearch kNN search.
 Showcases dense_vector + cosine similarity capabilities.
 """
-import asyncio
+import httpx
+from aiolimiter import AsyncLimiter
+from elasticsearch.helpers import async_bulk
 from google import genai
+from google.genai import errors as genai_errors
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from src.elasticsearch.client import get_es_client
 from config import get_settings
 
 settings = get_settings()
 _gemini = genai.Client(api_key=settings.anthropic_api_key)
+# Token bucket shared by every embedding call in the process (its worker's share of the quota)
+_embed_limiter = AsyncLimiter(settings.per_worker(settings.gemini_embed_rpm), 60)
+
+
+def quantize_int8(vector: list[float]) -> list[int] | None:
+    """
+    Scale a float embedding into the int8 range used by the byte dense_vector mappings.
+    Cosine similarity is scale-invariant, so per-vector max-abs scaling preserves ranking.
+    Returns None for an all-zero embedding: cosine is undefined for it and Elasticsearch
+    rejects it, so callers skip the vector field / kNN clause instead.
+    """
+    scale = max((abs(v) for v in vector), default=0.0)
+    if not scale:
+        return None
+    return [round(v * 127 / scale) for v in vector]
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on Gemini rate limits / server errors and on network failures."""
+    if isinstance(exc, genai_errors.ClientError):
+        return exc.code == 429
+    return isinstance(exc, (genai_errors.ServerError, httpx.TransportError))
+
+
+_backoff = wait_exponential(multiplier=0.5, min=0.5, max=8)
+
+
+def _wait_retry_after(retry_state) -> float:
+    """Honor a Retry-After header when Gemini sends one, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return _backoff(retry_state)
+
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=_wait_retry_after,
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+async def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Generate 384-dim embeddings for a batch of texts in one Gemini request.
+    Each attempt waits on the shared rate limiter; 429s, 5xx and network errors are retried.
+    """
+    async with _embed_limiter:
+        result = await _gemini.aio.models.embed_content(
+            model="gemini-embedding-001",
+            contents=texts,
+            config=genai.types.EmbedContentConfig(output_dimensionality=384),
+        )
+    return [e.values for e in result.embeddings]
 
 
 async def get_embedding(text: str) -> list[float]:
     """Generate a 384-dim embedding using Gemini's embedding model."""
-    result = await asyncio.to_thread(
-        _gemini.models.embed_content,
-        model="gemini-embedding-001",
-        contents=text,
-        config=genai.types.EmbedContentConfig(output_dimensionality=384),
-    )
-    return result.embeddings[0].values
+    return (await get_embeddings([text]))[0]
 
 
-async def semantic_search_news(query: str, size: int = 5) -> list[dict]:
+_NEWS_SOURCE = ["title", "entity_names", "source_name", "published_at",
+                "sentiment_label", "sentiment_score", "topics"]
+
+
+def _news_knn(vector: list[float], size: int, days: int | None = None,
+              entity_name: str | None = None, num_candidates: int | None = None) -> dict | None:
+    """
+    kNN clause over news content_vector for an (unquantized) query embedding, or None
+    if the embedding is all zeros (nothing to search with).
+    `days` / `entity_name` go in the kNN filter, so the HNSW walk only considers
+    matching articles instead of post-filtering the top k. num_candidates
+    (the recall/latency knob) defaults to 10 per result, at least 50.
+    """
+    query_vector = quantize_int8(vector)
+    if query_vector is None:
+        return None
+    knn = {
+        "field": "content_vector",
+        "query_vector": query_vector,
+        "k": size,
+        "num_candidates": num_candidates or max(50, 10 * size),
+    }
+    filters = []
+    if days:
+        filters.append({"range": {"published_at": {"gte": f"now-{int(days)}d"}}})
+    if entity_name:
+        filters.append({"term": {"entity_names": entity_name}})
+    if filters:
+        knn["filter"] = filters
+    return knn
+
+
+def _scored_hits(hits: list[dict]) -> list[dict]:
+    """Hit sources with each hit's kNN score attached as `_score`."""
+    return [{**hit["_source"], "_score": hit["_score"]} for hit in hits]
+
+
+async def semantic_search_news(query: str, size: int = 5, days: int | None = None,
+                               entity_name: str | None = None, num_candidates: int | None = None) -> list[dict]:
     """
     Semantic search over news articles using kNN vector search.
     1. Embed the query text
-    2. Run kNN search on content_vector field
+    2. Run kNN search on content_vector field (optionally limited to the last
+       `days` days and/or articles mentioning `entity_name`)
     3. Return ranked results with scores
     """
     es = get_es_client()
-    vector = await get_embedding(query)
+    knn = _news_knn(await get_embedding(query), size, days, entity_name, num_candidates)
+    if knn is None:
+        return []
 
     result = await es.search(
         index=settings.index_news,
-        knn={
-            "field": "content_vector",
-            "query_vector": vector,
-            "k": size,
-            "num_candidates": 50,
-        },
-        source=["title", "entity_names", "source_name", "published_at",
-                "sentiment_label", "sentiment_score", "topics"],
+        knn=knn,
+        source=_NEWS_SOURCE,
     )
-
-    hits = []
-    for hit in result["hits"]["hits"]:
-        doc = hit["_source"]
-        doc["_score"] = hit["_score"]
-        hits.append(doc)
-    return hits
+    return _scored_hits(result["hits"]["hits"])
 
 
 async def embed_and_update_news():
@@ -78,24 +160,32 @@ async def embed_and_update_news():
     if not docs:
         return 0
 
-    count = 0
+    batch = []
     for doc in docs:
         src = doc["_source"]
         text = (src.get("title", "") + " " + src.get("content", ""))[:500]
-        if not text.strip():
-            continue
-
-        try:
-            vector = await get_embedding(text)
-            await es.update(
-                index=settings.index_news,
-                id=doc["_id"],
-                body={"doc": {"content_vector": vector}},
-            )
-            count += 1
-            # Rate limit: small delay between embedding calls
-            await asyncio.sleep(0.1)
-        except Exception as e:
-            print(f"  Failed to embed {doc['_id']}: {e}")
+        if text.strip():
+            batch.append((doc["_id"], text))
+    if not batch:
+        return 0
 
+    # One embedding request for the whole page, one _bulk request for the writes
+    try:
+        vectors = await get_embeddings([text for _, text in batch])
+    except Exception as e:
+        print(f"  Failed to embed {len(batch)} news articles: {e}")
+        return 0
+
+    count, errors = await async_bulk(
+        es,
+        (
+            {"_op_type": "update", "_index": settings.index_news, "_id": doc_id,
+             "doc": {"content_vector": quantized}}
+            for (doc_id, _), vector in zip(batch, vectors)
+            if (quantized := quantize_int8(vector)) is not None
+        ),
+        raise_on_error=False,
+    )
+    for err in errors:
+        print(f"  Failed to update vector: {err}")
     return count
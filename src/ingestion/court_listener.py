@@ -6,21 +6,31 @@ No API key required for basic access.
 """
 import httpx
 from datetime import datetime, timezone
+from src.elasticsearch.bulk import BulkBuffer
 from src.elasticsearch.client import get_es_client
+from src.ingestion.http import use_client, get_with_retry
 from config import get_settings
 
 settings = get_settings()
 
 COURTLISTENER_BASE = "https://www.courtlistener.com/api/rest/v4"
+# Ingest pipeline (see indices.PIPELINES) that normalizes each docket server-side
+COURTLISTENER_PIPELINE = "meridian-court-listener"
 
 
-async def ingest_company_cases(company_name: str, entity_id: str):
-    """Search CourtListener for cases involving a company and ingest them."""
+async def ingest_company_cases(company_name: str, entity_id: str,
+                               client: httpx.AsyncClient | None = None, buffer: BulkBuffer | None = None):
+    """
+    Search CourtListener for cases involving a company and ingest them.
+    Pass `client` to reuse a pooled connection, and `buffer` to batch writes
+    into the caller's bulk buffer instead of indexing each case directly.
+    """
     es = get_es_client()
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with use_client(client) as client:
         # Search dockets (court cases)
-        resp = await client.get(
+        resp = await get_with_retry(
+            client,
             f"{COURTLISTENER_BASE}/dockets/",
             params={
                 "q": company_name,
@@ -36,45 +46,34 @@ async def ingest_company_cases(company_name: str, entity_id: str):
 
         data = resp.json()
         results = data.get("results", [])
+        # One ingest timestamp for every case in this response
+        now = datetime.now(timezone.utc).isoformat()
 
         for case in results:
             case_number = case.get("docket_number", "")
-            case_name = case.get("case_name", "")
-            court = case.get("court_id", "")
-            date_filed = case.get("date_filed")
-            date_terminated = case.get("date_terminated")
-            nature_of_suit = case.get("nature_of_suit", "")
-
-            # Determine case type from nature of suit
-            case_type = "civil"
-            if any(w in nature_of_suit.lower() for w in ["securities", "fraud", "antitrust"]):
-                case_type = "regulatory"
-
-            status = "resolved" if date_terminated else "active"
-
+            # jurisdiction, source, case_type, status and the summary are filled in
+            # server-side by the meridian-court-listener ingest pipeline
             doc = {
                 "case_id": f"cl-{case_number.replace(' ', '-')}",
                 "entity_ids": [entity_id],
                 "entity_names": [company_name],
-                "case_type": case_type,
-                "case_name": case_name,
-                "case_summary": f"{nature_of_suit} - {case_name}",
-                "court": court,
-                "jurisdiction": "US Federal",
-                "filed_date": date_filed,
-                "resolved_date": date_terminated,
-                "status": status,
-                "allegations": [nature_of_suit] if nature_of_suit else [],
-                "is_sanction": False,
-                "source": "CourtListener",
+                "case_name": case.get("case_name", ""),
+                "nature_of_suit": case.get("nature_of_suit", ""),
+                "court": case.get("court_id", ""),
+                "filed_date": case.get("date_filed"),
+                "resolved_date": case.get("date_terminated"),
                 "source_url": f"https://www.courtlistener.com{case.get('absolute_url', '')}",
-                "ingested_at": datetime.now(timezone.utc).isoformat(),
+                "ingested_at": now,
             }
 
-            await es.index(
-                index=settings.index_legal,
-                id=doc["case_id"],
-                document=doc,
-            )
+            if buffer is not None:
+                await buffer.add(settings.index_legal, doc, doc["case_id"], pipeline=COURTLISTENER_PIPELINE)
+            else:
+                await es.index(
+                    index=settings.index_legal,
+                    id=doc["case_id"],
+                    document=doc,
+                    pipeline=COURTLISTENER_PIPELINE,
+                )
 
     print(f"  Ingested {len(results)} court cases for {company_name} from CourtListener")
@@ -4,10 +4,14 @@ Uses GDELT (Global Database of Events, Language, and Tone) - completely free, no
 GDELT monitors news in 65 languages across the entire world.
 Docs: https://blog.gdeltproject.org/gdelt-2-0-our-global-world-in-realtime/
 """
+import re
 import httpx
 import hashlib
 from datetime import datetime, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from src.elasticsearch.client import get_es_client
+from src.elasticsearch.bulk import BulkBuffer
+from src.ingestion.http import use_client, get_with_retry
 from config import get_settings
 
 settings = get_settings()
@@ -15,24 +19,38 @@ settings = get_settings()
 GDELT_API = "https://api.gdeltproject.org/api/v2/doc/doc"
 
 
+NEGATIVE_WORDS = {
+    "fraud", "scandal", "lawsuit", "investigation", "bankrupt", "crisis",
+    "violation", "fine", "penalty", "arrested", "convicted", "collapse",
+    "failure", "loss", "decline", "warning", "risk", "concern", "alleged",
+}
+POSITIVE_WORDS = {
+    "growth", "profit", "award", "expansion", "innovation", "partnership",
+    "record", "milestone", "success", "acquisition", "investment", "launch",
+}
+
+# Every sentiment word in one alternation, so a title is scanned once rather than once per word
+_SENTIMENT_PATTERN = re.compile("|".join(map(re.escape, sorted(NEGATIVE_WORDS | POSITIVE_WORDS))))
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL for dedup: lowercase scheme/host, sorted query params,
+    no fragment or trailing slash. The path keeps its case (it's significant).
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
 def _simple_sentiment(text: str) -> tuple[float, str]:
     """
     Simple rule-based sentiment for demo purposes.
     In production, use Claude or a dedicated sentiment model.
     """
-    NEGATIVE_WORDS = {
-        "fraud", "scandal", "lawsuit", "investigation", "bankrupt", "crisis",
-        "violation", "fine", "penalty", "arrested", "convicted", "collapse",
-        "failure", "loss", "decline", "warning", "risk", "concern", "alleged",
-    }
-    POSITIVE_WORDS = {
-        "growth", "profit", "award", "expansion", "innovation", "partnership",
-        "record", "milestone", "success", "acquisition", "investment", "launch",
-    }
-
-    text_lower = text.lower()
-    neg = sum(1 for w in NEGATIVE_WORDS if w in text_lower)
-    pos = sum(1 for w in POSITIVE_WORDS if w in text_lower)
+    found = set(_SENTIMENT_PATTERN.findall(text.lower()))
+    neg = len(found & NEGATIVE_WORDS)
+    pos = len(found & POSITIVE_WORDS)
     total = neg + pos or 1
 
     score = (pos - neg) / total
@@ -40,12 +58,18 @@ def _simple_sentiment(text: str) -> tuple[float, str]:
     return round(score, 3), label
 
 
-async def ingest_company_news(company_name: str, entity_id: str, max_articles: int = 50):
-    """Fetch and ingest news for a company from GDELT."""
+async def ingest_company_news(company_name: str, entity_id: str, max_articles: int = 50,
+                              client: httpx.AsyncClient | None = None, buffer: BulkBuffer | None = None):
+    """
+    Fetch and ingest news for a company from GDELT.
+    Pass `client` to reuse a pooled connection, and `buffer` to batch writes
+    into the caller's bulk buffer instead of indexing each article directly.
+    """
     es = get_es_client()
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(
+    async with use_client(client) as client:
+        resp = await get_with_retry(
+            client,
             GDELT_API,
             params={
                 "query": f'"{company_name}"',
@@ -62,6 +86,9 @@ async def ingest_company_news(company_name: str, entity_id: str, max_articles: i
 
         data = resp.json()
         articles = data.get("articles", [])
+        # One ingest timestamp for every article in this response
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
 
         for article in articles:
             title = article.get("title", "")
@@ -75,11 +102,11 @@ async def ingest_company_news(company_name: str, entity_id: str, max_articles: i
                     tzinfo=timezone.utc
                 )
             except Exception:
-                pub_date = datetime.now(timezone.utc)
+                pub_date = now
 
             sentiment_score, sentiment_label = _simple_sentiment(title)
 
-            article_id = hashlib.md5(url.encode()).hexdigest()
+            article_id = hashlib.blake2b(_canonical_url(url).encode(), digest_size=16).hexdigest()
 
             doc = {
                 "article_id": article_id,
@@ -93,13 +120,16 @@ async def ingest_company_news(company_name: str, entity_id: str, max_articles: i
                 "sentiment_score": sentiment_score,
                 "sentiment_label": sentiment_label,
                 "language": article.get("language", "English"),
-                "ingested_at": datetime.now(timezone.utc).isoformat(),
+                "ingested_at": now_iso,
             }
 
-            await es.index(
-                index=settings.index_news,
-                id=article_id,
-                document=doc,
-            )
+            if buffer is not None:
+                await buffer.add(settings.index_news, doc, article_id)
+            else:
+                await es.index(
+                    index=settings.index_news,
+                    id=article_id,
+                    document=doc,
+                )
 
     print(f"  Ingested {len(articles)} news articles for {company_name} from GDELT")
@@ -0,0 +1,72 @@
+"""
+Shared HTTP helpers for the ingesters.
+One process-wide pooled httpx.AsyncClient (HTTP/2 where the host supports it)
+backs every fetch unless the caller passes its own, and rate-limited /
+unavailable responses are retried with Retry-After aware backoff.
+"""
+import asyncio
+import random
+from contextlib import asynccontextmanager
+
+import httpx
+
+RETRY_STATUSES = {429, 503}
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # Keep-alive (and HTTP/2 multiplexing) across every ingester, so repeat
+        # fetches from GDELT / CourtListener / EDGAR skip the TCP+TLS handshake
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def use_client(client: httpx.AsyncClient | None = None):
+    """Yield `client` if given, otherwise the shared process-wide client."""
+    yield client if client is not None else get_http_client()
+
+
+def _retry_wait(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if sent, else 2^attempt + jitter."""
+    try:
+        return float(resp.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return 2 ** attempt + random.random()
+
+
+async def get_with_retry(client: httpx.AsyncClient, url: str, max_attempts: int = 4, **kwargs) -> httpx.Response:
+    """GET `url`, backing off on 429/503 (Retry-After if sent, else 2^attempt + jitter)."""
+    for attempt in range(max_attempts):
+        resp = await client.get(url, **kwargs)
+        if resp.status_code not in RETRY_STATUSES or attempt == max_attempts - 1:
+            return resp
+        await asyncio.sleep(_retry_wait(resp, attempt))
+    return resp
+
+
+@asynccontextmanager
+async def stream_with_retry(client: httpx.AsyncClient, url: str, max_attempts: int = 4, **kwargs):
+    """Streaming get_with_retry: yields the final response with its body still unread."""
+    for attempt in range(max_attempts):
+        async with client.stream("GET", url, **kwargs) as resp:
+            if resp.status_code not in RETRY_STATUSES or attempt == max_attempts - 1:
+                yield resp
+                return
+            wait = _retry_wait(resp, attempt)
+        await asyncio.sleep(wait)
@@ -0,0 +1,13 @@
+"""
+Event-loop setup shared by the ingestion scripts.
+"""
+import asyncio
+
+
+def use_uvloop():
+    """Run on uvloop when available (it ships with uvicorn[standard]); stock asyncio otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
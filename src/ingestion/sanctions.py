@@ -7,51 +7,103 @@ Also handles EU and UN sanctions lists.
 import httpx
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
+from src.elasticsearch.bulk import BulkBuffer
 from src.elasticsearch.client import get_es_client
+from src.ingestion.http import get_http_client
 from config import get_settings
 
 settings = get_settings()
 
 OFAC_SDN_URL = "https://www.treasury.gov/ofac/downloads/sdn.xml"
 
+# Clark-notation namespace prefix; matching tags directly avoids per-lookup path parsing
+_NS = "{https://tempuri.org/sdnList.xsd}"
+_SCALAR_FIELDS = {f"{_NS}sdnType": "sdn_type", f"{_NS}lastName": "last_name",
+                  f"{_NS}firstName": "first_name", f"{_NS}uid": "uid"}
 
-async def ingest_ofac_sanctions():
-    """Download and ingest the OFAC SDN list."""
+
+def _sdn_record(entry) -> dict:
+    """
+    Project one sdnEntry element down to the fields used downstream.
+    The entry's children are walked once; everything else (addresses, IDs,
+    dates of birth, ...) is skipped without being converted.
+    """
+    rec = {"sdn_type": "", "last_name": "", "first_name": "", "uid": "",
+           "programs": [], "aliases": []}
+    for child in entry:
+        field = _SCALAR_FIELDS.get(child.tag)
+        if field:
+            rec[field] = child.text or ""
+        elif child.tag == f"{_NS}programList":
+            # Programs this entity is sanctioned under
+            rec["programs"] = [p.text for p in child if p.text]
+        elif child.tag == f"{_NS}akaList":
+            rec["aliases"] = [aka.findtext(f"{_NS}lastName", default="") for aka in child]
+    first, last = rec.pop("first_name"), rec.pop("last_name")
+    rec["full_name"] = f"{first} {last}".strip() if first else last
+    return rec
+
+
+async def _stream_sdn_entries(resp: httpx.Response):
+    """
+    Yield one record per sdnEntry while the SDN XML is still downloading.
+    Each completed entry is dropped from the tree once projected, so memory
+    stays at one entry rather than the whole document.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    async for chunk in resp.aiter_bytes():
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+            elif elem.tag == f"{_NS}sdnEntry":
+                yield _sdn_record(elem)
+                root.clear()
+    parser.close()
+
+
+async def ingest_ofac_sanctions(buffer: BulkBuffer | None = None):
+    """
+    Download and ingest the OFAC SDN list.
+    Every entry yields a legal sanction doc (organisations an entity doc too), all
+    written through `buffer` (the caller's bulk buffer, or one owned and flushed
+    here) rather than one index call per doc.
+    """
     es = get_es_client()
+    owned = buffer is None
+    if owned:
+        buffer = BulkBuffer(es)
 
     print("  Downloading OFAC SDN list...")
-    async with httpx.AsyncClient(timeout=120, follow_redirects=True) as client:
-        resp = await client.get(OFAC_SDN_URL)
+    async with get_http_client().stream("GET", OFAC_SDN_URL, timeout=120) as resp:
         if resp.status_code != 200:
             print(f"  Failed to download OFAC SDN: {resp.status_code}")
             return
+        count = await _ingest_sdn_entries(resp, buffer)
+
+    if owned:
+        await buffer.flush()
+    print(f"  Ingested {count} OFAC SDN entries")
 
-    root = ET.fromstring(resp.content)
-    ns = {"sdn": "https://tempuri.org/sdnList.xsd"}
 
+async def _ingest_sdn_entries(resp: httpx.Response, buffer: BulkBuffer) -> int:
+    """Queue the docs for every SDN entry as it is parsed; returns the entry count."""
     count = 0
-    for entry in root.findall(".//sdn:sdnEntry", ns):
-        entry_type = entry.findtext("sdn:sdnType", namespaces=ns, default="")
-        last_name = entry.findtext("sdn:lastName", namespaces=ns, default="")
-        first_name = entry.findtext("sdn:firstName", namespaces=ns, default="")
-        uid = entry.findtext("sdn:uid", namespaces=ns, default="")
-
-        full_name = f"{first_name} {last_name}".strip() if first_name else last_name
-
-        # Programs this entity is sanctioned under
-        programs = [
-            p.text for p in entry.findall("sdn:programList/sdn:program", ns)
-            if p.text
-        ]
-
-        # Aliases
-        aliases = [
-            aka.findtext("sdn:lastName", namespaces=ns, default="")
-            for aka in entry.findall("sdn:akaList/sdn:aka", ns)
-        ]
+    # One ingest timestamp for the whole list
+    now = datetime.now(timezone.utc).isoformat()
+    async for entry in _stream_sdn_entries(resp):
+        uid = entry["uid"]
+        entry_type = entry["sdn_type"]
+        full_name = entry["full_name"]
+        programs = entry["programs"]
+        aliases = entry["aliases"]
 
+        # Sanctioned organisations also become entities, so Entity Discovery can
+        # resolve them as a target. Individuals get only the legal record below: the
+        # executives index is searched by employer, which an SDN person record lacks.
         if entry_type == "Entity":
-            # Ingest as entity
             doc = {
                 "entity_id": f"ofac-{uid}",
                 "name": full_name,
@@ -62,34 +114,12 @@ async def ingest_ofac_sanctions():
                 "risk_score": 10.0,
                 "risk_flags": ["OFAC Sanctioned", f"Programs: {', '.join(programs)}"],
                 "data_sources": ["OFAC SDN"],
-                "ingested_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "ingested_at": now,
+                "updated_at": now,
             }
-            await es.index(
-                index=settings.index_entities,
-                id=f"ofac-{uid}",
-                document=doc,
-            )
-        else:
-            # Person — ingest as executive/person
-            doc = {
-                "person_id": f"ofac-{uid}",
-                "full_name": full_name,
-                "aliases": aliases,
-                "is_sanctioned": True,
-                "is_pep": False,
-                "risk_score": 10.0,
-                "risk_flags": ["OFAC Sanctioned", f"Programs: {', '.join(programs)}"],
-                "data_sources": ["OFAC SDN"],
-                "ingested_at": datetime.now(timezone.utc).isoformat(),
-            }
-            await es.index(
-                index=settings.index_executives,
-                id=f"ofac-{uid}",
-                document=doc,
-            )
+            await buffer.add(settings.index_entities, doc, f"ofac-{uid}")
 
-        # Also add as a legal record (sanction)
+        # Every entry is a legal record (sanction)
         legal_doc = {
             "case_id": f"ofac-sanction-{uid}",
             "entity_names": [full_name] + aliases,
@@ -103,14 +133,10 @@ async def ingest_ofac_sanctions():
             "allegations": programs,
             "source": "US Treasury OFAC",
             "source_url": "https://www.treasury.gov/resource-center/sanctions/SDN-List/",
-            "ingested_at": datetime.now(timezone.utc).isoformat(),
+            "ingested_at": now,
         }
-        await es.index(
-            index=settings.index_legal,
-            id=f"ofac-sanction-{uid}",
-            document=legal_doc,
-        )
+        await buffer.add(settings.index_legal, legal_doc, f"ofac-sanction-{uid}")
 
         count += 1
 
-    print(f"  Ingested {count} OFAC SDN entries")
+    return count
@@ -5,8 +5,15 @@ API docs: https://efts.sec.gov/LATEST/search-index?q=&dateRange=custom
 """
 import httpx
 import asyncio
+import time
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
 from datetime import datetime, timezone
+from pathlib import Path
 from src.elasticsearch.client import get_es_client
+from src.elasticsearch.bulk import BulkBuffer
+from src.ingestion.http import get_http_client, use_client, get_with_retry, stream_with_retry
 from config import get_settings
 
 settings = get_settings()
@@ -15,66 +22,163 @@ EDGAR_BASE = "https://efts.sec.gov"
 EDGAR_SUBMISSIONS = "https://data.sec.gov/submissions"
 EDGAR_SEARCH = "https://efts.sec.gov/LATEST/search-index"
 
+# us-gaap concepts the filing docs are built from
+FACT_CONCEPTS = frozenset({"Revenues", "NetIncomeLoss", "Assets"})
+
+# Annual-report form types that become filing docs
+_ANNUAL_FORMS = frozenset({"10-K", "10-K405", "10-KSB", "20-F", "40-F"})
+
+# SEC's declared fair-use limit is 10 requests/second per client, across all its hosts
+_edgar_limiter = AsyncLimiter(10, 1)
+
 HEADERS = {
     "User-Agent": "MERIDIAN hackathon@meridian-intelligence.io",
-    "Accept-Encoding": "gzip, deflate",
+    "Accept": "application/json",
+    # Brotli first: companyfacts JSON compresses far better than with gzip (httpx decodes it)
+    "Accept-Encoding": "br, gzip, deflate",
 }
 
 
 async def search_company(name: str) -> list[dict]:
     """Search for a company on EDGAR by name."""
-    async with httpx.AsyncClient(headers=HEADERS, timeout=30) as client:
-        resp = await client.get(
+    async with _edgar_limiter:
+        resp = await get_http_client().get(
             "https://efts.sec.gov/LATEST/search-index",
             params={"q": name, "dateRange": "custom", "category": "form-type"},
+            headers=HEADERS,
         )
-        resp.raise_for_status()
-        return resp.json().get("hits", {}).get("hits", [])
+    resp.raise_for_status()
+    return orjson.loads(resp.content).get("hits", {}).get("hits", [])
+
+
+async def get_fact_index(cik: str, client: httpx.AsyncClient | None = None,
+                         concepts: frozenset[str] = FACT_CONCEPTS) -> dict[tuple[str, str], float]:
+    """
+    Get the company's annual financial facts from SEC as a (concept, year) index.
+    companyfacts runs to tens of MB, nearly all of it concepts we never read, so it
+    is parsed as it downloads and only the wanted concepts are ever materialized.
+    The built index is cached on disk (settings.edgar_cache_dir): within
+    edgar_facts_ttl_hours it is used as-is, after that revalidated with a
+    conditional GET, so an unchanged company costs a 304 and no parse.
+    """
+    cik_padded = cik.zfill(10)
+    cached = _load_cached_facts(cik_padded, concepts)
+    if cached is not None and cached["fresh"]:
+        return cached["index"]
+    headers = HEADERS
+    if cached is not None:
+        # Conditional GET: SEC answers 304 with no body if the facts haven't changed
+        headers = HEADERS | {k: v for k, v in cached["validators"].items() if v}
+
+    index = {}
+    async with _edgar_limiter, use_client(client) as client, stream_with_retry(
+        client, f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_padded}.json", headers=headers,
+    ) as resp:
+        if resp.status_code == 304 and cached is not None:
+            _facts_cache_path(cik_padded).touch()  # revalidated: fresh for another TTL
+            return cached["index"]
+        if resp.status_code != 200:
+            return index
+        validators = {
+            "If-None-Match": resp.headers.get("etag"),
+            "If-Modified-Since": resp.headers.get("last-modified"),
+        }
+        # (concept, body) pairs under facts.us-gaap, pushed out as each one closes
+        found = ijson.sendable_list()
+        parser = ijson.kvitems_coro(found, "facts.us-gaap", use_float=True)
+        async for chunk in resp.aiter_bytes():
+            parser.send(chunk)
+            _index_concepts(index, found, concepts)
+        parser.close()
+        _index_concepts(index, found, concepts)
+    _store_cached_facts(cik_padded, concepts, index, validators)
+    return index
+
+
+def _facts_cache_path(cik_padded: str) -> Path | None:
+    return Path(settings.edgar_cache_dir) / f"facts-CIK{cik_padded}.json" if settings.edgar_cache_dir else None
+
+
+def _load_cached_facts(cik_padded: str, concepts: frozenset[str]) -> dict | None:
+    """
+    The cached fact index and its validators, if present and built for the same
+    concepts; `fresh` when it was written within edgar_facts_ttl_hours.
+    """
+    path = _facts_cache_path(cik_padded)
+    if path is None:
+        return None
+    try:
+        age_hours = (time.time() - path.stat().st_mtime) / 3600
+        cached = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if set(cached.get("concepts", [])) != concepts:
+        return None
+    return {
+        "fresh": age_hours < settings.edgar_facts_ttl_hours,
+        "validators": cached.get("validators", {}),
+        "index": {(concept, year): value for concept, year, value in cached.get("index", [])},
+    }
 
 
-async def get_company_facts(cik: str) -> dict:
-    """Get company financial facts from SEC."""
-    cik_padded = cik.zfill(10)
-    async with httpx.AsyncClient(headers=HEADERS, timeout=30) as client:
-        resp = await client.get(f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_padded}.json")
-        if resp.status_code == 200:
-            return resp.json()
-        return {}
+def _store_cached_facts(cik_padded: str, concepts: frozenset[str], index: dict[tuple[str, str], float],
+                        validators: dict[str, str | None]):
+    """Persist a freshly built fact index; skipped when SEC sent nothing to revalidate against."""
+    path = _facts_cache_path(cik_padded)
+    if path is None or not any(validators.values()):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps({
+            "concepts": sorted(concepts),
+            "validators": validators,
+            "index": [[concept, year, value] for (concept, year), value in index.items()],
+        }))
+    except OSError as e:
+        print(f"  Could not cache EDGAR facts for CIK {cik_padded}: {e}")
 
 
-async def get_submissions(cik: str) -> dict:
+async def get_submissions(cik: str, client: httpx.AsyncClient | None = None) -> dict:
     """Get all filings for a company."""
     cik_padded = cik.zfill(10)
-    async with httpx.AsyncClient(headers=HEADERS, timeout=30) as client:
-        resp = await client.get(f"{EDGAR_SUBMISSIONS}/CIK{cik_padded}.json")
+    async with _edgar_limiter, use_client(client) as client:
+        resp = await get_with_retry(client, f"{EDGAR_SUBMISSIONS}/CIK{cik_padded}.json", headers=HEADERS)
         if resp.status_code == 200:
-            return resp.json()
+            return orjson.loads(resp.content)
         return {}
 
 
-async def ingest_company(company_name: str, cik: str):
-    """Full ingestion pipeline for a company from EDGAR."""
-    es = get_es_client()
-
-    submissions = await get_submissions(cik)
-    facts = await get_company_facts(cik)
+async def ingest_company(company_name: str, cik: str, client: httpx.AsyncClient | None = None,
+                         buffer: BulkBuffer | None = None):
+    """
+    Full ingestion pipeline for a company from EDGAR.
+    Pass `client` to reuse a pooled connection. The entity and filing docs are
+    written through `buffer` (the caller's bulk buffer, or one owned and
+    flushed here), so a company costs one _bulk request rather than one per doc.
+    """
+    owned = buffer is None
+    if owned:
+        buffer = BulkBuffer(get_es_client())
+
+    # Independent fetches: overlap them on the pooled client
+    submissions, fact_index = await asyncio.gather(get_submissions(cik, client), get_fact_index(cik, client))
+    # Per-company constants, computed once rather than per filing
+    now = datetime.now(timezone.utc).isoformat()
+    entity_id = f"sec-{cik}"
+    source_url_base = f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type="
 
     company_info = {
-        "entity_id": f"sec-{cik}",
+        "entity_id": entity_id,
         "name": submissions.get("name", company_name),
         "entity_type": "company",
         "jurisdiction": "US",
         "sic_codes": [str(submissions.get("sic", ""))],
         "data_sources": ["SEC EDGAR"],
-        "ingested_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "ingested_at": now,
+        "updated_at": now,
     }
 
-    await es.index(
-        index=settings.index_entities,
-        id=f"sec-{cik}",
-        document=company_info,
-    )
+    await buffer.add(settings.index_entities, company_info, entity_id)
 
     # Ingest recent filings
     recent = submissions.get("filings", {}).get("recent", {})
@@ -82,46 +186,55 @@ async def ingest_company(company_name: str, cik: str):
     dates = recent.get("filingDate", [])
     descriptions = recent.get("primaryDocument", [])
 
-    annual_forms = {"10-K", "10-K405", "10-KSB", "20-F", "40-F"}
-
-    for i, (form, date) in enumerate(zip(forms, dates)):
-        if form in annual_forms:
-            # Extract financial data from facts if available
-            revenue = _extract_fact(facts, "Revenues", date)
-            net_income = _extract_fact(facts, "NetIncomeLoss", date)
-            total_assets = _extract_fact(facts, "Assets", date)
-
-            filing_doc = {
-                "filing_id": f"sec-{cik}-{i}",
-                "entity_id": f"sec-{cik}",
-                "entity_name": company_info["name"],
-                "filing_type": form,
-                "filing_date": date,
-                "revenue": revenue,
-                "net_income": net_income,
-                "total_assets": total_assets,
-                "source": "SEC EDGAR",
-                "source_url": f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type={form}",
-                "ingested_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            await es.index(
-                index=settings.index_filings,
-                id=f"sec-{cik}-{i}",
-                document=filing_doc,
-            )
+    # Positions of the annual reports (that have a date); only those need a doc
+    annual = [i for i, form in enumerate(forms[:len(dates)]) if form in _ANNUAL_FORMS]
+    # Fields every filing doc of this company shares
+    filing_base = {
+        "entity_id": entity_id,
+        "entity_name": company_info["name"],
+        "source": "SEC EDGAR",
+        "ingested_at": now,
+    }
 
+    for i in annual:
+        form, date = forms[i], dates[i]
+        # Extract financial data from facts if available
+        year = date[:4]
+        revenue = fact_index.get(("Revenues", year))
+        net_income = fact_index.get(("NetIncomeLoss", year))
+        total_assets = fact_index.get(("Assets", year))
+
+        filing_doc = filing_base | {
+            "filing_id": f"{entity_id}-{i}",
+            "filing_type": form,
+            "filing_date": date,
+            "revenue": revenue,
+            "net_income": net_income,
+            "total_assets": total_assets,
+            "source_url": source_url_base + form,
+        }
+
+        await buffer.add(settings.index_filings, filing_doc, filing_doc["filing_id"])
+
+    if owned:
+        await buffer.flush()
     print(f"  Ingested SEC EDGAR data for {company_info['name']} (CIK: {cik})")
 
 
-def _extract_fact(facts: dict, concept: str, date: str) -> float | None:
-    """Extract a specific financial fact for a given period."""
-    try:
-        us_gaap = facts.get("facts", {}).get("us-gaap", {})
-        concept_data = us_gaap.get(concept, {}).get("units", {}).get("USD", [])
-        for entry in reversed(concept_data):
-            if entry.get("form") in ("10-K", "20-F") and entry.get("end", "").startswith(date[:4]):
-                return float(entry.get("val", 0))
-        return None
-    except Exception:
-        return None
+def _index_concepts(index: dict[tuple[str, str], float], found: list, concepts: frozenset[str]):
+    """
+    Fold parsed (concept, body) pairs into `index`, mapping (concept, year) to the
+    USD value reported on a 10-K/20-F for a period ending that year. When several
+    entries match, the last one listed wins. Drains `found`.
+    """
+    for concept, body in found:
+        if concept not in concepts:
+            continue
+        for entry in body.get("units", {}).get("USD", []):
+            if entry.get("form") not in ("10-K", "20-F"):
+                continue
+            try:
+                index[(concept, entry.get("end", "")[:4])] = float(entry.get("val", 0))
+            except (TypeError, ValueError):
+                continue
+    del found[:]
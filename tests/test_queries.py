@@ -0,0 +1,44 @@
+"""ES|QL entity filters: loose targets still reach the resolved entity's docs."""
+from src.agents.context import InvestigationContext
+from src.elasticsearch import queries
+
+
+def _term(field: str, value: str) -> dict:
+    return {"term": {field: {"value": value, "case_insensitive": True}}}
+
+
+def _resolved_context() -> InvestigationContext:
+    context = InvestigationContext()
+    context.set_primary({"entity_id": "sec-1318605", "name": "Tesla, Inc.", "aliases": ["Tesla Motors"]}, {})
+    return context
+
+
+def test_names_for_adds_resolved_name_and_aliases():
+    assert InvestigationContext.names_for("tesla", _resolved_context()) == ["tesla", "Tesla, Inc.", "Tesla Motors"]
+
+
+def test_partial_target_filters_on_resolved_names():
+    names = InvestigationContext.names_for("Tesla", _resolved_context())
+    query = queries.esql_financial_trend(names)
+    assert query.filter == {
+        "bool": {
+            "should": [
+                _term("entity_name", "Tesla"),
+                _term("entity_name", "Tesla, Inc."),
+                _term("entity_name", "Tesla Motors"),
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+    assert "Tesla" not in query.query
+
+
+def test_case_different_target_filters_case_insensitively():
+    query = queries.esql_sentiment_trend(["TESLA MOTORS"], days=30)
+    assert query.filter["bool"]["should"] == [_term("entity_names", "TESLA MOTORS")]
+    assert query.filter["bool"]["minimum_should_match"] == 1
+
+
+def test_filter_dedupes_and_skips_empty_names():
+    clauses = queries.entity_name_filter("entity_name", ["Acme", "", "Acme"])["bool"]["should"]
+    assert clauses == [_term("entity_name", "Acme")]